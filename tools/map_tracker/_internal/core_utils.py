@@ -1,8 +1,8 @@
 import sys
 import os
-import re
 import math
 import base64
+import functools
 import tkinter as tk
 from typing import Literal, TypeAlias
 
@@ -20,18 +20,108 @@ except ImportError:
     print(f"  Please run 'pip install numpy' first.")
     sys.exit(1)
 
-try:
-    import cv2
-except ImportError:
-    print(f"{_R}Cannot import 'opencv-python'!{_0}")
-    print(f"  Please run 'pip install opencv-python' first.")
-    sys.exit(1)
+# OpenCV constants used as default arguments, mirrored here so that they
+# do not force the cv2 import at module load
+_FONT_HERSHEY_SIMPLEX = 0
+_LINE_4 = 4
+_LINE_8 = 8
+_FILLED = -1
+
+_cv2_mod = None
+
+
+def _cv2():
+    """Import OpenCV on first use and return it. Tools that only parse map
+    names never pay for the import.
+    """
+    global _cv2_mod
+    if _cv2_mod is None:
+        try:
+            import cv2
+        except ImportError:
+            print(f"{_R}Cannot import 'opencv-python'!{_0}")
+            print(f"  Please run 'pip install opencv-python' first.")
+            sys.exit(1)
+        _cv2_mod = cv2
+    return _cv2_mod
+
+
+def __getattr__(name: str):
+    # Keeps `from _internal.core_utils import cv2` working for the GUI tools
+    if name == "cv2":
+        return _cv2()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 Point: TypeAlias = tuple[int, int]
 Color: TypeAlias = int  # 0xRRGGBB
 MapType: TypeAlias = Literal["normal", "tier", "base", "dung"]
 
+_MAP_KIND_PREFIXES = ("map", "base", "dung")
+_TIER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+def _scan_digits(s: str, i: int) -> int:
+    """Return the end of the run of decimal digits starting at s[i]."""
+    n = len(s)
+    while i < n and s[i].isdecimal():
+        i += 1
+    return i
+
+
+def _split_map_name(
+    name: str,
+) -> tuple[str, str, str, str | None, str | None, str | None] | None:
+    """Split a lowercase map name into (kind, map, lv, x, y, tier).
+
+    Accepts exactly the names matched by the pattern
+    ``(map|base|dung)\\d+_lv\\d+(_\\d+_\\d+)?(_tier_[a-z0-9_]+)?``,
+    including a single trailing newline as ``$`` would. Returns None when
+    the name does not fit.
+    """
+    if name.endswith("\n"):
+        name = name[:-1]
+    for kind in _MAP_KIND_PREFIXES:
+        if name.startswith(kind):
+            break
+    else:
+        return None
+
+    i = len(kind)
+    j = _scan_digits(name, i)
+    if j == i or not name.startswith("_lv", j):
+        return None
+    map_digits = name[i:j]
+    i = j + 3
+    j = _scan_digits(name, i)
+    if j == i:
+        return None
+    lv = name[i:j]
+
+    # Optional "_{x}_{y}"; once a digit follows "_" it must be complete
+    x = y = None
+    n = len(name)
+    if j + 1 < n and name[j] == "_" and name[j + 1].isdecimal():
+        i = j + 1
+        j = _scan_digits(name, i)
+        x = name[i:j]
+        if not name.startswith("_", j):
+            return None
+        i = j + 1
+        j = _scan_digits(name, i)
+        if j == i:
+            return None
+        y = name[i:j]
+
+    tier = None
+    if j < n:
+        if not name.startswith("_tier_", j):
+            return None
+        tier = name[j + 6 :]
+        if not tier or not _TIER_CHARS.issuperset(tier):
+            return None
+    return kind, map_digits, lv, x, y, tier
+
 
 ICON_DATA = {
     "AssertLocation": "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAC7UlEQVR4AdSWIXMUQRCFJ6jEgQOXuMjEgQsOFIXEgUQBClAQBwokuDh+AjjiiEscuETiiEvc8b256a7O3M7cLimK4qp7e6b7Tfeb3tnbvZL+8e//JjCbzdall2nipA5QbBM9Q7NQ+FiaJ/OLYlv4RssoAuReRWdk/Y6uoi1R7BDsWQtQ+5cSINkmi+qE5/heoLeLvsaeoiaZMGvXzdGyXQIkuMpC7RqT5WRl/lvDvEX3i+5ir4FYQ09Qk+OSw+YLtksA9C/U5A1FNmwyZImfo8KoIwaJOczntkkA5q8cldIBiV+GeSKu3WGy6PB5u8Hugt1Hs4CIubLPLk0CAHwXJLzF3IWEOpBekIAOnwjpvDBNiTU6H6n8PFeZu+kRMNCeDWQprkdPQ6mKSDWWHuoS9IONWafzZFO3gwQAP3dESo/DWEPb+Qa7zIcQ531Uok7Imj6zAfYhuiCDBEDtoFkookcuj3VhbhJP+xPFagUY196r45q3CFxXcIzSrXfgjPBdxi0ZfwvI8ANdKhR/CkiKSXvs+Etq/wZztjoQHyE/2QO5tXu5jyj+SIOoEIyd9JwRM0iAZB8D6FMYt4YPGoHP5q9ymjsNEvDofNB7u20D2Sb5YHuJ9dYSTl0C/udDK+vnOy+msFp/lCfVhTXxHeK5KlibAMkPANtjtEXChbOALwu4C4JTO3d8yXUBY5Nlt0BvOMPGHeldUP/pGE42dizmUOyCdgnAXB3w/3F25t8FJabX8krMCEbvCXO9Bxe/E8zvtktAKBLozfZTY1QfGt4JYiKIey4U9xieU+LxrxjXoiwloCUkuiFbVN+FX8vYDcXV9njfu623haMICAyJ2OodCvozzvgbGB08TNKrOGJT7zeaQEmiT64yTHcorA9Q7fymOSui5m7aSQRIrnseSWjX0lyA+Oid5wVcJhEAr/bWJOSWf3JxLZxMQIvYqT4+rWAcKzxJ/4iAVYCIJN4SC422lyIwukoH+NcJdGrn0G8AAAD//yDmQk4AAAAGSURBVAMAn0P5QeU4gvcAAAAASUVORK5CYII=",
@@ -57,6 +147,7 @@ def get_icon_image(icon_name: str | None) -> np.ndarray | None:
     try:
         decoded = base64.b64decode(raw)
         arr = np.frombuffer(decoded, dtype=np.uint8)
+        cv2 = _cv2()
         img = cv2.imdecode(arr, cv2.IMREAD_UNCHANGED)
         _GLOBAL_ICON_CACHE[icon_name] = img
         return img
@@ -79,6 +170,70 @@ def clipboard_copy_text(text: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1024)
+def _text_size(
+    text: str, font_face: int, font_scale: float, thickness: int
+) -> tuple[int, int]:
+    """cv2.getTextSize width and height, memoized across Drawer instances
+    since labels such as coordinates and level ids repeat every frame."""
+    cv2 = _cv2()
+    return cv2.getTextSize(text, font_face, font_scale, thickness)[0]
+
+
+@functools.lru_cache(maxsize=256)
+def _to_bgr(color: Color) -> tuple[int, int, int]:
+    """Convert 0xRRGGBB to an OpenCV BGR tuple."""
+    r = (color >> 16) & 0xFF
+    g = (color >> 8) & 0xFF
+    b = color & 0xFF
+    return (b, g, r)
+
+
+def alpha_blend(
+    fg: np.ndarray, bg: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Composite BGRA `fg` over `bg` (BGR or BGRA) and return the result in
+    the layout of `bg`. Only the trailing channel axis is special, so stacks
+    of equally sized regions can be blended in a single call.
+
+    The "over" operator is evaluated in integer fixed point scaled by 255*255,
+    so no float temporaries are needed and results are rounded to nearest.
+    The result is written to `out` if given, which may be `bg` itself.
+    """
+    if out is None:
+        out = np.empty_like(bg)
+    a = fg[..., 3:4].astype(np.uint16)
+    if bg.shape[-1] != 4:
+        # Opaque destination: round((fg * a + bg * (255 - a)) / 255), with the
+        # division done as ((t + 128) + ((t + 128) >> 8)) >> 8 in uint16
+        t = np.multiply(fg[..., :3], a, dtype=np.uint16)
+        t += bg[..., :3] * (255 - a)
+        t += 128
+        t += t >> 8
+        t >>= 8
+        np.copyto(out, t, casting="unsafe")
+        return out
+
+    # Weights of the foreground and background colors, both scaled by 255^2;
+    # they and their sum never exceed 255 * 255, so uint16 is enough
+    w_fg = a * 255
+    w_bg = bg[..., 3:4] * (255 - a)
+    den = w_fg + w_bg
+
+    # Only the weighted color sums need 32 bits
+    num = np.multiply(fg[..., :3], w_fg, dtype=np.uint32)
+    num += np.multiply(bg[..., :3], w_bg, dtype=np.uint32)
+    num += den >> 1
+
+    # Everything is read from bg above, so out may safely alias it
+    num //= np.maximum(den, 1)
+    np.copyto(out[..., :3], num, casting="unsafe")
+    den += 127
+    den //= 255
+    np.copyto(out[..., 3:4], den, casting="unsafe")
+    return out
+
+
 class MapName:
     """Parser for MapTracker map names.
 
@@ -157,29 +312,16 @@ class MapName:
         stem, _ = os.path.splitext(basename)
         name = stem.lower()
 
-        tile_m = re.match(
-            r"^(?P<kind>map|base|dung)(?P<map>\d+)_lv(?P<lv>\d+)_(?P<x>\d+)_(?P<y>\d+)(?:_tier_(?P<tier>[a-z0-9_]+))?$",
-            name,
-        )
-        merged_m = re.match(
-            r"^(?P<kind>map|base|dung)(?P<map>\d+)_lv(?P<lv>\d+)(?:_tier_(?P<tier>[a-z0-9_]+))?$",
-            name,
-        )
-
-        if is_tile:
-            if not tile_m:
+        parts = _split_map_name(name)
+        if parts is None or (parts[3] is not None) != is_tile:
+            if is_tile:
                 raise ValueError(f"expected tile map name format: {name_or_path}")
-            m = tile_m
-        else:
-            if not merged_m:
-                raise ValueError(f"expected non-tile map name format: {name_or_path}")
-            m = merged_m
+            raise ValueError(f"expected non-tile map name format: {name_or_path}")
 
-        kind = m.group("kind")
-        map_id = f"{kind}{m.group('map')}"
-        map_level_id = f"lv{m.group('lv')}"
+        kind, map_digits, lv, x, y, tier_suffix = parts
+        map_id = f"{kind}{map_digits}"
+        map_level_id = f"lv{lv}"
         map_type: MapType
-        tier_suffix = m.group("tier")
         if tier_suffix is not None:
             map_type = "tier"
         elif kind == "map":
@@ -188,8 +330,8 @@ class MapName:
             map_type = "base"
         else:
             map_type = "dung"
-        tile_x = int(m.group("x")) if is_tile else None
-        tile_y = int(m.group("y")) if is_tile else None
+        tile_x = int(x) if is_tile else None
+        tile_y = int(y) if is_tile else None
         return MapName(
             map_id=map_id,
             map_level_id=map_level_id,
@@ -201,19 +343,23 @@ class MapName:
 
 
 class Drawer:
-    def __init__(self, img: cv2.Mat, font_face: int = cv2.FONT_HERSHEY_SIMPLEX):
+    def __init__(self, img: np.ndarray, font_face: int = _FONT_HERSHEY_SIMPLEX):
+        _cv2()
+        # Drawing goes through to the caller's buffer, so a non-contiguous
+        # view is kept as is rather than copied
         self._img = img
+        self._h, self._w = img.shape[:2]
         self._font_face = font_face
 
     @property
     def w(self):
         """Image width in pixels."""
-        return self._img.shape[1]
+        return self._w
 
     @property
     def h(self):
         """Image height in pixels."""
-        return self._img.shape[0]
+        return self._h
 
     def get_image(self):
         """Return the underlying image buffer."""
@@ -222,14 +368,9 @@ class Drawer:
     def get_text_size(self, text: str, font_scale: float):
         """Measure text size for current font settings."""
         thickness = max(1, int(round(font_scale * 2)))
-        return cv2.getTextSize(text, self._font_face, font_scale, thickness)[0]
+        return _text_size(text, self._font_face, font_scale, thickness)
 
-    @staticmethod
-    def _to_bgr(color: Color) -> tuple[int, int, int]:
-        r = (color >> 16) & 0xFF
-        g = (color >> 8) & 0xFF
-        b = color & 0xFF
-        return (b, g, r)
+    _to_bgr = staticmethod(_to_bgr)
 
     def text(
         self,
@@ -240,7 +381,9 @@ class Drawer:
         color: Color,
         bg_color: Color | None = None,
         bg_padding: int = 5,
+        line_type: int = _LINE_8,
     ):
+        cv2 = _cv2()
         thickness = max(1, int(round(font_scale * 2)))
         if bg_color is not None:
             text_size = self.get_text_size(text, font_scale)
@@ -249,7 +392,8 @@ class Drawer:
                 (pos[0] - bg_padding, pos[1] - text_size[1] - bg_padding),
                 (pos[0] + text_size[0] + bg_padding, pos[1] + bg_padding),
                 self._to_bgr(bg_color),
-                -1,
+                _FILLED,
+                _LINE_4,
             )
         cv2.putText(
             self._img,
@@ -259,6 +403,7 @@ class Drawer:
             font_scale,
             self._to_bgr(color),
             thickness,
+            line_type,
         )
 
     def text_centered(
@@ -273,14 +418,92 @@ class Drawer:
         x = pos[0] - text_size[0] // 2
         self.text(text, (int(x), int(pos[1])), font_scale, color=color)
 
-    def rect(self, pt1: Point, pt2: Point, *, color: Color, thickness: int):
-        cv2.rectangle(self._img, pt1, pt2, self._to_bgr(color), thickness)
+    # Rectangles are axis-aligned, where 4- and 8-connected rasterization
+    # produce the same pixels, so the cheaper LINE_4 is the default
+    def rect(
+        self,
+        pt1: Point,
+        pt2: Point,
+        *,
+        color: Color,
+        thickness: int,
+        line_type: int = _LINE_4,
+    ):
+        cv2 = _cv2()
+        cv2.rectangle(self._img, pt1, pt2, self._to_bgr(color), thickness, line_type)
+
+    def circle(
+        self,
+        center: Point,
+        radius: int,
+        *,
+        color: Color,
+        thickness: int,
+        line_type: int = _LINE_8,
+    ):
+        cv2 = _cv2()
+        cv2.circle(
+            self._img, center, radius, self._to_bgr(color), thickness, line_type
+        )
 
-    def circle(self, center: Point, radius: int, *, color: Color, thickness: int):
-        cv2.circle(self._img, center, radius, self._to_bgr(color), thickness)
+    def circles(
+        self,
+        centers,
+        radius: int,
+        *,
+        color: Color,
+        thickness: int,
+        line_type: int = _LINE_8,
+    ):
+        """Draw many circles of one style, given as an (N, 2) array or a
+        sequence of points, sharing one color conversion."""
+        cv2 = _cv2()
+        if len(centers) == 0:
+            return
+        img = self._img
+        bgr = self._to_bgr(color)
+        for x, y in np.asarray(centers, dtype=np.int32).tolist():
+            cv2.circle(img, (x, y), radius, bgr, thickness, line_type)
+
+    def line(
+        self,
+        pt1: Point,
+        pt2: Point,
+        *,
+        color: Color,
+        thickness: int,
+        line_type: int = _LINE_8,
+    ):
+        cv2 = _cv2()
+        cv2.line(self._img, pt1, pt2, self._to_bgr(color), thickness, line_type)
 
-    def line(self, pt1: Point, pt2: Point, *, color: Color, thickness: int):
-        cv2.line(self._img, pt1, pt2, self._to_bgr(color), thickness)
+    def lines(
+        self, segments, *, color: Color, thickness: int, line_type: int = _LINE_8
+    ):
+        """Draw many (pt1, pt2) segments of one style with a single call."""
+        cv2 = _cv2()
+        if len(segments) == 0:
+            return
+        pts = np.asarray(segments, dtype=np.int32).reshape(-1, 2, 1, 2)
+        cv2.polylines(self._img, pts, False, self._to_bgr(color), thickness, line_type)
+
+    def rects(self, rects, *, color: Color, thickness: int, line_type: int = _LINE_4):
+        """Draw many (pt1, pt2) rectangles of one style. Outlines are drawn
+        with a single call; filled rectangles share one color conversion."""
+        cv2 = _cv2()
+        if len(rects) == 0:
+            return
+        bgr = self._to_bgr(color)
+        if thickness < 0:
+            for pt1, pt2 in rects:
+                cv2.rectangle(self._img, pt1, pt2, bgr, thickness, line_type)
+            return
+        r = np.asarray(rects, dtype=np.int32).reshape(-1, 4)
+        x1, y1, x2, y2 = r[:, 0], r[:, 1], r[:, 2], r[:, 3]
+        quads = np.stack((x1, y1, x2, y1, x2, y2, x1, y2), axis=1)
+        cv2.polylines(
+            self._img, quads.reshape(-1, 4, 1, 2), True, bgr, thickness, line_type
+        )
 
     def crosshair(
         self,
@@ -293,8 +516,8 @@ class Drawer:
     ) -> None:
         cx, cy = center
         if full_screen:
-            self.line((cx, 0), (cx, self.h), color=color, thickness=thickness)
-            self.line((0, cy), (self.w, cy), color=color, thickness=thickness)
+            self.line((cx, 0), (cx, self._h), color=color, thickness=thickness)
+            self.line((0, cy), (self._w, cy), color=color, thickness=thickness)
             return
 
         arm = max(1, int(size))
@@ -302,6 +525,7 @@ class Drawer:
         self.line((cx, cy - arm), (cx, cy + arm), color=color, thickness=thickness)
 
     def mask(self, pt1: Point, pt2: Point, *, color: Color, alpha: float) -> None:
+        cv2 = _cv2()
         x1, y1 = pt1
         x2, y2 = pt2
         if x1 == x2 or y1 == y2:
@@ -310,18 +534,24 @@ class Drawer:
             x1, x2 = x2, x1
         if y1 > y2:
             y1, y2 = y2, y1
-        h, w = self._img.shape[:2]
+        h, w = self._h, self._w
         x1 = max(0, min(w, x1))
         x2 = max(0, min(w, x2))
         y1 = max(0, min(h, y1))
         y2 = max(0, min(h, y2))
-        if x2 <= x1 or y2 <= y1:
+        if x2 <= x1 or y2 <= y1 or alpha <= 0.0:
             return
 
         region = self._img[y1:y2, x1:x2]
-        overlay = np.empty_like(region)
-        overlay[:, :] = self._to_bgr(color)
-        cv2.addWeighted(region, 1 - alpha, overlay, alpha, 0, dst=region)
+        if alpha >= 1.0:
+            region[:, :] = self._to_bgr(color)
+            return
+        # region * (1 - alpha) + color * alpha as one affine color transform,
+        # applied in place without materializing a solid-color overlay
+        m = np.zeros((3, 4))
+        m[(0, 1, 2), (0, 1, 2)] = 1 - alpha
+        m[:, 3] = np.multiply(self._to_bgr(color), alpha)
+        cv2.transform(region, m, dst=region)
 
     def paste(
         self,
@@ -332,16 +562,22 @@ class Drawer:
         scale_h: int | None = None,
         with_alpha: bool = False,
     ) -> None:
+        cv2 = _cv2()
         # Scale if needed
         if scale_w is not None or scale_h is not None:
             h, w = img.shape[:2]
             new_w = scale_w if scale_w is not None else w
             new_h = scale_h if scale_h is not None else h
-            img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+            if (new_w, new_h) != (w, h):
+                # INTER_AREA is faster and alias-free when shrinking
+                interpolation = (
+                    cv2.INTER_AREA if new_w * new_h < w * h else cv2.INTER_LINEAR
+                )
+                img = cv2.resize(img, (new_w, new_h), interpolation=interpolation)
 
         x, y = pos
         fh, fw = img.shape[:2]
-        bh, bw = self._img.shape[:2]
+        bh, bw = self._h, self._w
 
         # Clamp to canvas bounds
         x0, y0 = max(0, x), max(0, y)
@@ -357,35 +593,15 @@ class Drawer:
         target_fg = img[fy0:fy1, fx0:fx1]
 
         if with_alpha and img.shape[2] == 4:
-            # Alpha blending when alpha channel exists
-            alpha_fg = target_fg[:, :, 3:4].astype(np.float32) / 255.0
-            alpha_bg = (
-                target_bg[:, :, 3:4].astype(np.float32) / 255.0
-                if target_bg.shape[2] == 4
-                else np.ones_like(alpha_fg)
-            )
-
-            out_alpha = alpha_fg + alpha_bg * (1.0 - alpha_fg)
-            mask = out_alpha > 0
-            res_rgb = np.zeros_like(target_bg[:, :, :3], dtype=np.float32)
-
-            rgb_fg = target_fg[:, :, :3].astype(np.float32)
-            rgb_bg = target_bg[:, :, :3].astype(np.float32)
-
-            m_idx = mask[:, :, 0]
-            res_rgb[m_idx] = (
-                rgb_fg[m_idx] * alpha_fg[m_idx]
-                + rgb_bg[m_idx] * alpha_bg[m_idx] * (1.0 - alpha_fg[m_idx])
-            ) / out_alpha[m_idx]
-
-            res_bgra = np.zeros_like(target_bg, dtype=np.uint8)
-            res_bgra[:, :, :3] = np.clip(res_rgb, 0, 255).astype(np.uint8)
-            if target_bg.shape[2] == 4:
-                res_bgra[:, :, 3:4] = np.clip(out_alpha * 255.0, 0, 255).astype(
-                    np.uint8
-                )
-
-            self._img[y0:y1, x0:x1] = res_bgra
+            # Alpha blending when alpha channel exists; uniformly transparent
+            # or opaque regions need no per-pixel math
+            a_min, a_max = cv2.minMaxLoc(target_fg[:, :, 3])[:2]
+            if a_max == 0:
+                return
+            if a_min == 255:
+                self._img[y0:y1, x0:x1] = target_fg[:, :, : self._img.shape[2]]
+            else:
+                alpha_blend(target_fg, target_bg, out=target_bg)
         else:
             # Simple paste without alpha blending
             self._img[y0:y1, x0:x1] = target_fg
@@ -400,6 +616,7 @@ class Drawer:
         dash: int = 8,
         gap: int = 6,
     ) -> None:
+        cv2 = _cv2()
         x1, y1 = pt1
         x2, y2 = pt2
         dx = x2 - x1
@@ -410,6 +627,7 @@ class Drawer:
         nx, ny = dx / dist, dy / dist
         pos = 0.0
         drawing = True
+        bgr = self._to_bgr(color)
         while pos < dist:
             seg = dash if drawing else gap
             end_pos = min(pos + seg, dist)
@@ -418,7 +636,7 @@ class Drawer:
                 sy = int(round(y1 + ny * pos))
                 ex = int(round(x1 + nx * end_pos))
                 ey = int(round(y1 + ny * end_pos))
-                cv2.line(self._img, (sx, sy), (ex, ey), self._to_bgr(color), thickness)
+                cv2.line(self._img, (sx, sy), (ex, ey), bgr, thickness)
             pos = end_pos
             drawing = not drawing
 
@@ -432,6 +650,7 @@ class Drawer:
         arrow_size: int = 12,
     ) -> None:
         """Draw a line with an arrowhead at pt2."""
+        cv2 = _cv2()
         self.line(pt1, pt2, color=color, thickness=thickness)
         x1, y1 = pt1
         x2, y2 = pt2
@@ -445,8 +664,9 @@ class Drawer:
         ay1 = int(round(y2 - arrow_size * (ny + nx * 0.5)))
         ax2 = int(round(x2 - arrow_size * (nx + ny * 0.5)))
         ay2 = int(round(y2 - arrow_size * (ny - nx * 0.5)))
-        cv2.line(self._img, (x2, y2), (ax1, ay1), self._to_bgr(color), thickness)
-        cv2.line(self._img, (x2, y2), (ax2, ay2), self._to_bgr(color), thickness)
+        bgr = self._to_bgr(color)
+        cv2.line(self._img, (x2, y2), (ax1, ay1), bgr, thickness)
+        cv2.line(self._img, (x2, y2), (ax2, ay2), bgr, thickness)
 
     @staticmethod
     def new(w: int, h: int, **kwargs) -> "Drawer":
@@ -567,6 +787,7 @@ class MapImageLayer(Layer):
         self._scaled_zoom: float | None = None
 
     def render(self, drawer: Drawer) -> None:
+        cv2 = _cv2()
         zoom = self.view.zoom
         if self._scaled_img is None or self._scaled_zoom != zoom:
             scaled_w = max(1, int(self._img.shape[1] * zoom))
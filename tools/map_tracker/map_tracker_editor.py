@@ -109,40 +109,31 @@ class _PathLayer(Layer):
         points = self._page.points
         active_idx = self._page._get_active_point_idx()
         # Draw path lines
-        for i in range(len(points)):
-            sx, sy = self.view.get_view_coords(points[i][0], points[i][1])
-            if i > 0:
-                psx, psy = self.view.get_view_coords(points[i - 1][0], points[i - 1][1])
-                drawer.line(
-                    (psx, psy),
-                    (sx, sy),
-                    color=0xFF0000,
-                    thickness=max(1, int(self._page.LINE_WIDTH * self.view.zoom**0.5)),
-                )
+        view_pts = [self.view.get_view_coords(p[0], p[1]) for p in points]
+        drawer.lines(
+            list(zip(view_pts, view_pts[1:])),
+            color=0xFF0000,
+            thickness=max(1, int(self._page.LINE_WIDTH * self.view.zoom**0.5)),
+        )
 
         # Draw point circles
-        for i in range(len(points)):
-            sx, sy = self.view.get_view_coords(points[i][0], points[i][1])
-            radius = int(self._page.POINT_RADIUS * max(0.5, self.view.zoom**0.5))
+        radius = int(self._page.POINT_RADIUS * max(0.5, self.view.zoom**0.5))
+        drawer.circles(view_pts, radius, color=0xFF0000, thickness=-1)
+        if 0 <= active_idx < len(view_pts):
+            drawer.circle(view_pts[active_idx], radius, color=0xFFA500, thickness=-1)
+        selected_idx = self._page.selected_idx
+        if 0 <= selected_idx < len(view_pts) and self.view.zoom >= 1.0:
             drawer.circle(
-                (sx, sy),
-                radius,
-                color=0xFFA500 if i == active_idx else 0xFF0000,
-                thickness=-1,
+                view_pts[selected_idx],
+                max(1, radius - 1),
+                color=0xFF0000,
+                thickness=int(self._page.LINE_WIDTH * self.view.zoom**0.5),
             )
-            if i == self._page.selected_idx and self.view.zoom >= 1.0:
-                drawer.circle(
-                    (sx, sy),
-                    max(1, radius - 1),
-                    color=0xFF0000,
-                    thickness=int(self._page.LINE_WIDTH * self.view.zoom**0.5),
-                )
 
         # Draw point index labels
-        for i in range(len(points)):
+        for i, (sx, sy) in enumerate(view_pts):
             if self.view.zoom < 1.0 and i not in (0, len(points) - 1):
                 continue
-            sx, sy = self.view.get_view_coords(points[i][0], points[i][1])
             drawer.text(str(i), (sx + 5, sy - 5), 0.5, color=0xFFFFFF)
 
 
@@ -12,10 +12,24 @@ import os
 import re
 import json
 import shutil
+import time
 import numpy as np
 from collections import defaultdict, deque
-from typing import Dict, List, Tuple, NamedTuple
-from _internal.core_utils import _R, _G, _Y, _C, _A, _0, Drawer, cv2, Point, MapName
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, NamedTuple
+from _internal.core_utils import (
+    _R,
+    _G,
+    _Y,
+    _C,
+    _A,
+    _0,
+    Drawer,
+    cv2,
+    Point,
+    MapName,
+    alpha_blend,
+)
 
 
 class TileInfo(NamedTuple):
@@ -39,6 +53,14 @@ class MergeMapConfig(NamedTuple):
 MAP_MERGED_DIR = "assets/resource/image/MapTracker/map_merged"
 MAP_FINAL_DIR = "assets/resource/image/MapTracker/map_final"
 
+_INV_255 = 1.0 / 255.0
+
+# Minimum interval between preview frames while loading tiles (seconds)
+_PREVIEW_INTERVAL = 1 / 30
+
+# Worker count for threaded image decoding (cv2.imread releases the GIL)
+_IO_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def ensure_output_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
@@ -47,6 +69,51 @@ def ensure_output_dir(path: str) -> None:
         f.write("*\n")
 
 
+def _iter_files(root: str) -> Iterator[Tuple[str, str]]:
+    """Yield (file_name, file_path) for every file under root.
+    Files of a directory come before those of its subdirectories, in the
+    same order as os.walk; symlinked directories are not followed.
+    """
+    sub_dirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        sub_dirs.append(entry.path)
+                else:
+                    yield entry.name, entry.path
+    except OSError:
+        return
+    for sub_dir in sub_dirs:
+        yield from _iter_files(sub_dir)
+
+
+def _grid_bounds(coords: Iterable[Tuple[int, int]]) -> Tuple[int, int]:
+    """Return (max_x, max_y) of the given tile coordinates in a single pass."""
+    max_x = max_y = 0
+    for x, y in coords:
+        if x > max_x:
+            max_x = x
+        if y > max_y:
+            max_y = y
+    return max_x, max_y
+
+
+def _mask_bbox(mask: np.ndarray) -> Tuple[int, int, int, int] | None:
+    """Return (x1, y1, x2, y2) bounding box of non-zero pixels, or None.
+    Uses row/column projections instead of materializing coordinate arrays."""
+    rows = mask.any(axis=1)
+    if not rows.any():
+        return None
+    cols = mask.any(axis=0)
+    y1 = int(rows.argmax())
+    y2 = len(rows) - int(rows[::-1].argmax())
+    x1 = int(cols.argmax())
+    x2 = len(cols) - int(cols[::-1].argmax())
+    return x1, y1, x2, y2
+
+
 default_config = MergeMapConfig(
     scale=0.1625,
     flip_x=False,
@@ -55,6 +122,85 @@ default_config = MergeMapConfig(
 )
 
 
+def _make_cell_origin(flip: bool, step: int) -> Callable:
+    """Build f(coord, max_coord) returning the pixel origin of a 1-based tile
+    coordinate along one axis, specialized once for the flip setting.
+    Works on plain ints as well as NumPy arrays."""
+    if flip:
+        return lambda coord, max_coord: (max_coord - coord) * step
+    return lambda coord, max_coord: (coord - 1) * step
+
+
+_cell_x = _make_cell_origin(default_config.flip_x, default_config.force_size[0])
+_cell_y = _make_cell_origin(default_config.flip_y, default_config.force_size[1])
+
+# Alignment direction -> (x, y) factors of the slack between cell and tile size
+_ALIGN_OFFSETS: Dict[str, Tuple[int, int]] = {
+    "lt": (0, 0),
+    "rt": (1, 0),
+    "lb": (0, 1),
+    "rb": (1, 1),
+}
+
+
+_EDGE_L, _EDGE_R, _EDGE_T, _EDGE_B = 1, 2, 4, 8
+_EDGE_BITS = np.array((_EDGE_L, _EDGE_R, _EDGE_T, _EDGE_B))
+
+
+def _build_auto_align_table(kind: str) -> Tuple[str | None, ...]:
+    """Map every edge bitmask to the unique alignment it implies, or None.
+    kind is "w" for full-width tiles, "h" for full-height tiles and
+    "corner" for tiles smaller in both dimensions."""
+    table = []
+    for mask in range(16):
+        l, r, t, b = (bool(mask & bit) for bit in (_EDGE_L, _EDGE_R, _EDGE_T, _EDGE_B))
+        if kind == "w":
+            candidates = [("lt", t), ("lb", b)]
+        elif kind == "h":
+            candidates = [("lt", l), ("rt", r)]
+        else:
+            candidates = [
+                ("lt", l and t),
+                ("rt", r and t),
+                ("lb", l and b),
+                ("rb", r and b),
+            ]
+        matched = [d for d, flag in candidates if flag]
+        table.append(matched[0] if len(matched) == 1 else None)
+    return tuple(table)
+
+
+_AUTO_ALIGN = {kind: _build_auto_align_table(kind) for kind in ("w", "h", "corner")}
+
+
+def _align_xy(mode: str, x_pos: int, y_pos: int, tw: int, th: int) -> Point:
+    """Position of a tw x th tile aligned to a corner of the cell at (x_pos, y_pos)."""
+    assert mode in _ALIGN_OFFSETS, f"invalid align mode: {mode}"
+    dx, dy = _ALIGN_OFFSETS[mode]
+    sw, sh = default_config.force_size
+    return x_pos + dx * (sw - tw), y_pos + dy * (sh - th)
+
+
+def _aligned_positions(tiles: List[TileInfo], max_x: int, max_y: int) -> np.ndarray:
+    """Canvas positions of the given tiles after applying their alignment,
+    as an (N, 2) int array. Tile fields are gathered into flat arrays so
+    all offsets are computed in a few vectorized operations."""
+    n = len(tiles)
+    sw, sh = default_config.force_size
+    fx = np.fromiter((t.file_x for t in tiles), dtype=np.int64, count=n)
+    fy = np.fromiter((t.file_y for t in tiles), dtype=np.int64, count=n)
+    tw = np.fromiter((t.raw_w for t in tiles), dtype=np.int64, count=n)
+    th = np.fromiter((t.raw_h for t in tiles), dtype=np.int64, count=n)
+    offsets = np.array([_ALIGN_OFFSETS[t.align_direction] for t in tiles]).reshape(n, 2)
+
+    x_pos = _cell_x(fx, max_x)
+    y_pos = _cell_y(fy, max_y)
+    return np.stack(
+        (x_pos + offsets[:, 0] * (sw - tw), y_pos + offsets[:, 1] * (sh - th)),
+        axis=1,
+    )
+
+
 class MergeMapPage:
     def __init__(self, map_types: list[str], input_dir: str, output_dir: str):
         self.map_types = map_types
@@ -63,25 +209,43 @@ class MergeMapPage:
         self.window_name = "MapTracker Merger"
         self.window_w, self.window_h = 1280, 720
         self.groups: Dict[str, Dict[Tuple[int, int], str]] = {}
+        # Bumped whenever tiles are blended into the working canvas
+        self._canvas_rev = 0
+        self._bg_cache: tuple | None = None
+        self._base_cache: tuple | None = None
+        self._thumb_cache: Dict[int, tuple] = {}
+        self._ruler_cache: Dict[tuple, tuple | None] = {}
 
         # Load and prepare data
         self._prepare_data()
 
+        # Flat scratch buffers shared by all groups, sized for the largest one
+        sw, sh = default_config.force_size
+        max_area = max(
+            (gx * sw * gy * sh for gx, gy in map(_grid_bounds, self.groups.values())),
+            default=0,
+        )
+        self._buffers: Dict[str, np.ndarray] = {
+            "canvas": np.empty(max_area * 4, dtype=np.uint8)
+        }
+
+    def _scratch(self, slot: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """Return an uninitialized, C-contiguous uint8 array of the given shape
+        backed by a reusable buffer. The buffer only ever grows.
+        """
+        size = int(np.prod(shape))
+        buf = self._buffers.get(slot)
+        if buf is None or buf.size < size:
+            buf = np.empty(size, dtype=np.uint8)
+            self._buffers[slot] = buf
+        return buf[:size].reshape(shape)
+
     def _get_tile_pos(
         self, tx: int, ty: int, scale: float, x_offset: int, y_offset: int, max_x: int
     ) -> Point:
         """Calculate scaled tile position on the canvas."""
-        sw, sh = default_config.force_size
-        tile_x = x_offset + int(
-            ((max_x - tx) * sw * scale)
-            if default_config.flip_x
-            else ((tx - 1) * sw * scale)
-        )
-        tile_y = y_offset + int(
-            ((self.max_y - ty) * sh * scale)
-            if default_config.flip_y
-            else ((ty - 1) * sh * scale)
-        )
+        tile_x = x_offset + int(_cell_x(tx, max_x) * scale)
+        tile_y = y_offset + int(_cell_y(ty, self.max_y) * scale)
         return tile_x, tile_y
 
     def _prepare_data(self) -> None:
@@ -95,23 +259,21 @@ class MergeMapPage:
 
         # Collect matching files
         groups = defaultdict(dict)
-        for root, _, file_names in os.walk(self.input_dir):
-            for file_name in file_names:
-                parsed = self._parse_tile_file(file_name)
-                if parsed is None:
-                    continue
-                name, x, y, parsed_type = parsed
-                if parsed_type not in self.map_types:
-                    continue
+        for file_name, file_path in _iter_files(self.input_dir):
+            parsed = self._parse_tile_file(file_name)
+            if parsed is None:
+                continue
+            name, x, y, parsed_type = parsed
+            if parsed_type not in self.map_types:
+                continue
 
-                file_path = os.path.join(root, file_name)
-                key = (x, y)
-                if key in groups[name]:
-                    print(
-                        f"{_Y}Warning: Duplicate tile at ({x}, {y}) for {name}, skipping{_0}"
-                    )
-                else:
-                    groups[name][key] = file_path
+            key = (x, y)
+            if key in groups[name]:
+                print(
+                    f"{_Y}Warning: Duplicate tile at ({x}, {y}) for {name}, skipping{_0}"
+                )
+            else:
+                groups[name][key] = file_path
 
         if not groups:
             print(f"{_R}No map tiles found in input directories.{_0}")
@@ -121,9 +283,7 @@ class MergeMapPage:
         self.normal_bounds: Dict[str, Tuple[int, int]] = {}
         for gname, tiles_dict in groups.items():
             if not self._is_tier_map_name(gname):
-                gmax_x = max(x for (x, y) in tiles_dict.keys())
-                gmax_y = max(y for (x, y) in tiles_dict.keys())
-                self.normal_bounds[gname] = (gmax_x, gmax_y)
+                self.normal_bounds[gname] = _grid_bounds(tiles_dict)
 
     @staticmethod
     def _is_tier_map_name(name: str) -> bool:
@@ -142,19 +302,245 @@ class MergeMapPage:
         group_name = os.path.splitext(parsed.map_full_name)[0]
         return group_name, int(parsed.tile_x), int(parsed.tile_y), parsed.map_type
 
-    def _has_opaque_pixels_on_edge(
-        self, img: np.ndarray, edge: str, threshold: int = 4
-    ) -> bool:
-        """Check if image has opaque pixels on the specified edge."""
-        if edge == "left":
-            return np.any(img[:, 0, 3] >= threshold)
-        elif edge == "right":
-            return np.any(img[:, -1, 3] >= threshold)
-        elif edge == "top":
-            return np.any(img[0, :, 3] >= threshold)
-        elif edge == "bottom":
-            return np.any(img[-1, :, 3] >= threshold)
-        return False
+    def _blend_standard_tiles(
+        self, canvas: np.ndarray, pending: List[Tuple[np.ndarray, int, int]]
+    ) -> None:
+        """Blend pending standard-size tiles into the canvas in one vectorized pass.
+        Every tile occupies its own grid cell, so the canvas can be viewed as a
+        (rows, tile_h, cols, tile_w, 4) grid and all cells composited at once.
+        """
+        if not pending:
+            return
+        sw, sh = default_config.force_size
+        # Fully transparent tiles leave the canvas untouched and fully opaque
+        # ones replace it, so only partially transparent tiles need blending
+        to_blend = []
+        for img, x, y in pending:
+            a_min, a_max = cv2.minMaxLoc(img[:, :, 3])[:2]
+            if a_max == 0:
+                continue
+            if a_min == 255:
+                canvas[y : y + sh, x : x + sw] = img
+            else:
+                to_blend.append((img, x, y))
+        pending.clear()
+        self._canvas_rev += 1
+        if not to_blend:
+            return
+
+        canvas_h, canvas_w = canvas.shape[:2]
+        grid = canvas.reshape(canvas_h // sh, sh, canvas_w // sw, sw, 4)
+        gx = np.fromiter((x // sw for _, x, _ in to_blend), dtype=np.intp)
+        gy = np.fromiter((y // sh for _, _, y in to_blend), dtype=np.intp)
+        tiles = np.stack([img for img, _, _ in to_blend])
+        grid[gy, :, gx] = alpha_blend(tiles, grid[gy, :, gx])
+
+    @staticmethod
+    def _load_tile(file_path: str) -> np.ndarray | None:
+        """Read a tile as BGRA, or return None if it cannot be decoded."""
+        img = cv2.imread(file_path, cv2.IMREAD_UNCHANGED)
+        if img is None or img.shape[2] == 4:
+            return img
+        h, w = img.shape[:2]
+        bgra = np.empty((h, w, 4), dtype=np.uint8)
+        bgra[:, :, :3] = img
+        bgra[:, :, 3] = 255
+        return bgra
+
+    @staticmethod
+    def _edge_opacity_mask(img: np.ndarray, threshold: int = 4) -> int:
+        """Return a bitmask of the edges (_EDGE_L/R/T/B) that have opaque pixels.
+        All four alpha edges are reduced in a single pass."""
+        alpha = img[:, :, 3]
+        h, w = alpha.shape
+        edges = np.concatenate((alpha[:, 0], alpha[:, -1], alpha[0, :], alpha[-1, :]))
+        edge_max = np.maximum.reduceat(edges, (0, h, 2 * h, 2 * h + w))
+        return int(np.dot(edge_max >= threshold, _EDGE_BITS))
+
+    def _thumbnail(self, img: np.ndarray, scale: float) -> np.ndarray:
+        """Return img downscaled by scale, cached per source image."""
+        cached = self._thumb_cache.get(id(img))
+        if cached is not None and cached[0] is img and cached[1] == scale:
+            return cached[2]
+        h, w = img.shape[:2]
+        thumb = cv2.resize(
+            img,
+            (max(1, round(w * scale)), max(1, round(h * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+        self._thumb_cache[id(img)] = (img, scale, thumb)
+        return thumb
+
+    def _render_background(
+        self,
+        canvas: np.ndarray,
+        manual_tiles: List[TileInfo],
+        max_x: int,
+        max_y: int,
+    ) -> Tuple[np.ndarray, int, int, float]:
+        """Return (scaled_canvas, x_offset, y_offset, scale) for the preview.
+        The result is cached until the canvas revision or a manual tile changes."""
+        key = (
+            id(canvas),
+            self._canvas_rev,
+            tuple((t.file_x, t.file_y, t.align_direction) for t in manual_tiles),
+        )
+        if self._bg_cache is not None and self._bg_cache[0] == key:
+            return self._bg_cache[1:]
+
+        # Scale canvas to fit window, keeping aspect ratio
+        ch, cw = canvas.shape[:2]
+        scale = min(self.window_w / cw, (self.window_h - 100) / ch)
+        new_w = int(cw * scale)
+        new_h = int(ch * scale)
+        base_key = (id(canvas), self._canvas_rev)
+        if self._base_cache is None or self._base_cache[0] != base_key:
+            # Only the color planes are displayed, so skip resizing alpha
+            base = cv2.resize(
+                np.ascontiguousarray(canvas[:, :, :3]),
+                (new_w, new_h),
+                interpolation=cv2.INTER_AREA,
+            )
+            self._base_cache = (base_key, base)
+        scaled_canvas = self._base_cache[1]
+
+        # Composite the manual tiles as pre-scaled thumbnails at display size
+        if manual_tiles:
+            scaled_canvas = scaled_canvas.copy()
+            preview_drawer = Drawer(scaled_canvas)
+            pos = _aligned_positions(manual_tiles, max_x, max_y)
+            for tile, (ax, ay) in zip(manual_tiles, pos.tolist()):
+                preview_drawer.paste(
+                    self._thumbnail(tile.raw_img, scale),
+                    (int(ax * scale), int(ay * scale)),
+                    with_alpha=True,
+                )
+
+        # Center the canvas
+        x_offset = (self.window_w - new_w) // 2
+        y_offset = ((self.window_h - 100) - new_h) // 2
+
+        self._bg_cache = (key, scaled_canvas, x_offset, y_offset, scale)
+        return scaled_canvas, x_offset, y_offset, scale
+
+    @staticmethod
+    def _draw_rulers(
+        drawer: Drawer,
+        max_x: int,
+        max_y: int,
+        scale: float,
+        x_offset: int,
+        y_offset: int,
+        new_h: int,
+    ) -> None:
+        sw, sh = default_config.force_size
+        for i in range(1, max_x + 1):
+            x_pos = x_offset + (i - 1) * sw * scale + sw * scale / 2
+            y_pos = y_offset + new_h + 15
+            drawer.text_centered(str(i), (x_pos, y_pos), 0.5, color=0xFFFF00)
+        for j in range(1, max_y + 1):
+            x_pos = x_offset - 20
+            y_pos = y_offset + (max_y - j) * sh * scale + sh * scale / 2
+            drawer.text_centered(str(j), (x_pos, y_pos), 0.5, color=0xFFFF00)
+
+    def _render_overlay(
+        self,
+        drawer: Drawer,
+        manual_tiles: List[TileInfo],
+        max_x: int,
+        max_y: int,
+        scale: float,
+        x_offset: int,
+        y_offset: int,
+        new_h: int,
+    ) -> None:
+        """Draw coordinate rulers and manual tile indicators over the preview."""
+        # Draw coordinate rulers. They normally sit on the empty margin around
+        # the scaled canvas, so the glyph pixels are rasterized once per layout
+        # and copied; if any would land on the canvas they are drawn directly
+        sw, sh = default_config.force_size
+        ruler_key = (max_x, max_y, round(scale, 4), x_offset, y_offset, new_h)
+        if ruler_key not in self._ruler_cache:
+            h, w = drawer.get_image().shape[:2]
+            ruler_drawer = Drawer.new(w, h)
+            self._draw_rulers(
+                ruler_drawer, max_x, max_y, scale, x_offset, y_offset, new_h
+            )
+            ruler_img = ruler_drawer.get_image()
+            on_canvas = ruler_img[
+                max(0, y_offset) : y_offset + new_h,
+                max(0, x_offset) : x_offset + int(max_x * sw * scale),
+            ]
+            if on_canvas.any():
+                self._ruler_cache[ruler_key] = None
+            else:
+                idx = np.nonzero(ruler_img.any(axis=2))
+                self._ruler_cache[ruler_key] = (idx, ruler_img[idx])
+        ruler = self._ruler_cache[ruler_key]
+        if ruler is None:
+            self._draw_rulers(drawer, max_x, max_y, scale, x_offset, y_offset, new_h)
+        else:
+            drawer._img[ruler[0]] = ruler[1]
+
+        # Draw yellow overlay and adjustment indicators for manual tiles
+        indicator_lines = []
+        for tile in manual_tiles:
+            x, y = tile.file_x, tile.file_y
+            tile_x, tile_y = self._get_tile_pos(x, y, scale, x_offset, y_offset, max_x)
+            tile_w = int(sw * scale)
+            tile_h = int(sh * scale)
+
+            # Semi-transparent yellow overlay
+            drawer.mask(
+                (tile_x, tile_y),
+                (tile_x + tile_w, tile_y + tile_h),
+                color=0xFFFF00,
+                alpha=0.2,
+            )
+
+            # Draw alignment indicator lines
+            mode = tile.align_direction
+            line_length = 20
+            if mode == "lt":
+                args1 = [
+                    (tile_x, tile_y),
+                    (tile_x + line_length, tile_y),
+                ]
+                args2 = [
+                    (tile_x, tile_y),
+                    (tile_x, tile_y + line_length),
+                ]
+            elif mode == "rt":
+                args1 = [
+                    (tile_x + tile_w - line_length, tile_y),
+                    (tile_x + tile_w, tile_y),
+                ]
+                args2 = [
+                    (tile_x + tile_w, tile_y),
+                    (tile_x + tile_w, tile_y + line_length),
+                ]
+            elif mode == "lb":
+                args1 = [
+                    (tile_x, tile_y + tile_h - line_length),
+                    (tile_x, tile_y + tile_h),
+                ]
+                args2 = [
+                    (tile_x, tile_y + tile_h),
+                    (tile_x + line_length, tile_y + tile_h),
+                ]
+            elif mode == "rb":
+                args1 = [
+                    (tile_x + tile_w - line_length, tile_y + tile_h),
+                    (tile_x + tile_w, tile_y + tile_h),
+                ]
+                args2 = [
+                    (tile_x + tile_w, tile_y + tile_h - line_length),
+                    (tile_x + tile_w, tile_y + tile_h),
+                ]
+
+            indicator_lines.append(args1)
+            indicator_lines.append(args2)
+        drawer.lines(indicator_lines, color=0xFFFF00, thickness=1)
 
     def _render_canvas(
         self,
@@ -169,122 +555,16 @@ class MergeMapPage:
         drawer = Drawer.new(self.window_w, self.window_h)
 
         if canvas is not None:
-            temp_canvas = canvas.copy()
-
-            # Apply current manual tile adjustments to display (preview)
-            temp_drawer = Drawer(temp_canvas)
-            for tile in manual_tiles:
-                mode = tile.align_direction
-                x_pos = (
-                    (max_x - tile.file_x) * default_config.force_size[0]
-                    if default_config.flip_x
-                    else (tile.file_x - 1) * default_config.force_size[0]
-                )
-                y_pos = (
-                    (max_y - tile.file_y) * default_config.force_size[1]
-                    if default_config.flip_y
-                    else (tile.file_y - 1) * default_config.force_size[1]
-                )
-                th, tw = tile.raw_img.shape[:2]
-                sw, sh = default_config.force_size
-                if mode == "lt":
-                    ax, ay = x_pos, y_pos
-                elif mode == "rt":
-                    ax, ay = x_pos + sw - tw, y_pos
-                elif mode == "lb":
-                    ax, ay = x_pos, y_pos + sh - th
-                elif mode == "rb":
-                    ax, ay = x_pos + sw - tw, y_pos + sh - th
-                else:
-                    ax, ay = x_pos, y_pos
-                temp_drawer.paste(tile.raw_img, (ax, ay), with_alpha=True)
-
-            # Scale canvas to fit window, keeping aspect ratio
-            ch, cw = temp_canvas.shape[:2]
-            scale = min(self.window_w / cw, (self.window_h - 100) / ch)
-            new_w = int(cw * scale)
-            new_h = int(ch * scale)
-            scaled_canvas = cv2.resize(
-                temp_canvas, (new_w, new_h), interpolation=cv2.INTER_LINEAR
+            scaled_canvas, x_offset, y_offset, scale = self._render_background(
+                canvas, manual_tiles, max_x, max_y
             )
-
-            # Center the canvas
-            x_offset = (self.window_w - new_w) // 2
-            y_offset = ((self.window_h - 100) - new_h) // 2
+            new_h, new_w = scaled_canvas.shape[:2]
             drawer._img[y_offset : y_offset + new_h, x_offset : x_offset + new_w] = (
-                scaled_canvas[:, :, :3]
+                scaled_canvas
+            )
+            self._render_overlay(
+                drawer, manual_tiles, max_x, max_y, scale, x_offset, y_offset, new_h
             )
-
-            # Draw coordinate rulers
-            sw, sh = default_config.force_size
-            for i in range(1, max_x + 1):
-                x_pos = x_offset + (i - 1) * sw * scale + sw * scale / 2
-                y_pos = y_offset + new_h + 15
-                drawer.text_centered(str(i), (x_pos, y_pos), 0.5, color=0xFFFF00)
-            for j in range(1, max_y + 1):
-                x_pos = x_offset - 20
-                y_pos = y_offset + (max_y - j) * sh * scale + sh * scale / 2
-                drawer.text_centered(str(j), (x_pos, y_pos), 0.5, color=0xFFFF00)
-
-            # Draw yellow overlay and adjustment indicators for manual tiles
-            for tile in manual_tiles:
-                x, y = tile.file_x, tile.file_y
-                tile_x, tile_y = self._get_tile_pos(
-                    x, y, scale, x_offset, y_offset, max_x
-                )
-                tile_w = int(sw * scale)
-                tile_h = int(sh * scale)
-
-                # Semi-transparent yellow overlay
-                drawer.mask(
-                    (tile_x, tile_y),
-                    (tile_x + tile_w, tile_y + tile_h),
-                    color=0xFFFF00,
-                    alpha=0.2,
-                )
-
-                # Draw alignment indicator lines
-                mode = tile.align_direction
-                line_length = 20
-                if mode == "lt":
-                    args1 = [
-                        (tile_x, tile_y),
-                        (tile_x + line_length, tile_y),
-                    ]
-                    args2 = [
-                        (tile_x, tile_y),
-                        (tile_x, tile_y + line_length),
-                    ]
-                elif mode == "rt":
-                    args1 = [
-                        (tile_x + tile_w - line_length, tile_y),
-                        (tile_x + tile_w, tile_y),
-                    ]
-                    args2 = [
-                        (tile_x + tile_w, tile_y),
-                        (tile_x + tile_w, tile_y + line_length),
-                    ]
-                elif mode == "lb":
-                    args1 = [
-                        (tile_x, tile_y + tile_h - line_length),
-                        (tile_x, tile_y + tile_h),
-                    ]
-                    args2 = [
-                        (tile_x, tile_y + tile_h),
-                        (tile_x + line_length, tile_y + tile_h),
-                    ]
-                elif mode == "rb":
-                    args1 = [
-                        (tile_x + tile_w - line_length, tile_y + tile_h),
-                        (tile_x + tile_w, tile_y + tile_h),
-                    ]
-                    args2 = [
-                        (tile_x + tile_w, tile_y + tile_h - line_length),
-                        (tile_x + tile_w, tile_y + tile_h),
-                    ]
-
-                drawer.line(*args1, color=0xFFFF00, thickness=1)
-                drawer.line(*args2, color=0xFFFF00, thickness=1)
 
         # Bottom bar
         drawer.line(
@@ -346,156 +626,112 @@ class MergeMapPage:
 
         if forced_bounds:
             max_x, max_y = forced_bounds
-            own_max_x = max(x for (x, y), _ in file_list)
-            own_max_y = max(y for (x, y), _ in file_list)
+            own_max_x, own_max_y = _grid_bounds(tiles_dict)
             print(
                 f"  {_Y}Aligning to normal map bounds: "
                 f"{own_max_x}x{own_max_y} -> {max_x}x{max_y}{_0}"
             )
         else:
-            max_x = max(x for (x, y), _ in file_list)
-            max_y = max(y for (x, y), _ in file_list)
+            max_x, max_y = _grid_bounds(tiles_dict)
         self.max_y = max_y  # Store for use in _get_tile_pos
 
         canvas_w = max_x * default_config.force_size[0]
         canvas_h = max_y * default_config.force_size[1]
-        canvas = np.zeros((canvas_h, canvas_w, 4), dtype=np.uint8)
-        canvas[:, :, 3] = 0
+        canvas = self._scratch("canvas", (canvas_h, canvas_w, 4))
+        canvas.fill(0)
+        self._thumb_cache.clear()
+        canvas_drawer = Drawer(canvas)
+        self._canvas_rev += 1
 
         all_tiles = []
         manual_tiles = []
+        pending_std: List[Tuple[np.ndarray, int, int]] = []
 
         # Load and process tiles
         total_steps = len(file_list)
-        for step, ((x, y), file_path) in enumerate(file_list):
-            img = cv2.imread(file_path, cv2.IMREAD_UNCHANGED)
-            if img is None:
-                continue
-            if img.shape[2] == 3:
-                img = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
-
-            tile = TileInfo(
-                file_name=os.path.basename(file_path),
-                file_x=x,
-                file_y=y,
-                raw_img=img,
-                raw_w=img.shape[1],
-                raw_h=img.shape[0],
-                align_mode=None,
-                align_direction=None,
-            )
-            all_tiles.append(tile)
-
-            x_pos = (
-                (max_x - x) * default_config.force_size[0]
-                if default_config.flip_x
-                else (x - 1) * default_config.force_size[0]
-            )
-            y_pos = (
-                (max_y - y) * default_config.force_size[1]
-                if default_config.flip_y
-                else (y - 1) * default_config.force_size[1]
-            )
+        last_render = float("-inf")
+        # Decode in worker threads (imread releases the GIL); tiles are still
+        # consumed in order so pasting stays on this thread
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            images = executor.map(self._load_tile, (fp for _, fp in file_list))
+            for step, (((x, y), file_path), img) in enumerate(zip(file_list, images)):
+                if img is None:
+                    continue
 
-            if (tile.raw_w, tile.raw_h) == default_config.force_size:
-                # Standard size - directly blend
-                canvas_drawer = Drawer(canvas)
-                canvas_drawer.paste(img, (x_pos, y_pos), with_alpha=True)
-            else:
-                # Non-standard size - detect alignment
-                auto_aligned = False
-                align_mode = None
-                flag_l = self._has_opaque_pixels_on_edge(img, "left")
-                flag_r = self._has_opaque_pixels_on_edge(img, "right")
-                flag_t = self._has_opaque_pixels_on_edge(img, "top")
-                flag_b = self._has_opaque_pixels_on_edge(img, "bottom")
-
-                sw, sh = default_config.force_size
-                if tile.raw_w == sw:
-                    true_flags = [
-                        ("t" if flag_t else None),
-                        ("b" if flag_b else None),
-                    ]
-                    true_flags = [f for f in true_flags if f]
-                    if len(true_flags) == 1:
-                        align_mode = true_flags[0]
-                        auto_aligned = True
-                elif tile.raw_h == sh:
-                    true_flags = [
-                        ("l" if flag_l else None),
-                        ("r" if flag_r else None),
-                    ]
-                    true_flags = [f for f in true_flags if f]
-                    if len(true_flags) == 1:
-                        align_mode = true_flags[0]
-                        auto_aligned = True
+                tile = TileInfo(
+                    file_name=os.path.basename(file_path),
+                    file_x=x,
+                    file_y=y,
+                    raw_img=img,
+                    raw_w=img.shape[1],
+                    raw_h=img.shape[0],
+                    align_mode=None,
+                    align_direction=None,
+                )
+                all_tiles.append(tile)
+
+                x_pos = _cell_x(x, max_x)
+                y_pos = _cell_y(y, max_y)
+
+                if (tile.raw_w, tile.raw_h) == default_config.force_size:
+                    # Standard size - defer and blend in batches
+                    if 0 <= x_pos < canvas_w and 0 <= y_pos < canvas_h:
+                        pending_std.append((img, x_pos, y_pos))
+                    else:
+                        canvas_drawer.paste(img, (x_pos, y_pos), with_alpha=True)
+                        self._canvas_rev += 1
                 else:
-                    flag_lt = flag_l and flag_t
-                    flag_rt = flag_r and flag_t
-                    flag_lb = flag_l and flag_b
-                    flag_rb = flag_r and flag_b
-                    true_corners = [
-                        ("lt" if flag_lt else None),
-                        ("rt" if flag_rt else None),
-                        ("lb" if flag_lb else None),
-                        ("rb" if flag_rb else None),
-                    ]
-                    true_corners = [c for c in true_corners if c]
-                    if len(true_corners) == 1:
-                        align_mode = true_corners[0]
-                        auto_aligned = True
-
-                if auto_aligned and align_mode:
-                    direction = align_mode.lower()
-                    if len(direction) == 1:
-                        if direction == "l":
-                            direction = "lt"
-                        elif direction == "r":
-                            direction = "rt"
-                        elif direction == "t":
-                            direction = "lt"
-                        elif direction == "b":
-                            direction = "lb"
-                    tile = tile._replace(align_mode="auto", align_direction=direction)
-                    all_tiles[-1] = tile
+                    # Non-standard size - detect alignment
+                    edge_mask = self._edge_opacity_mask(img)
 
                     sw, sh = default_config.force_size
-                    if align_mode == "l":
-                        ax, ay = x_pos, y_pos
-                    elif align_mode == "r":
-                        ax, ay = x_pos + sw - tile.raw_w, y_pos
-                    elif align_mode == "t":
-                        ax, ay = x_pos, y_pos
-                    elif align_mode == "b":
-                        ax, ay = x_pos, y_pos + sh - tile.raw_h
-                    elif align_mode == "lt":
-                        ax, ay = x_pos, y_pos
-                    elif align_mode == "rt":
-                        ax, ay = x_pos + sw - tile.raw_w, y_pos
-                    elif align_mode == "lb":
-                        ax, ay = x_pos, y_pos + sh - tile.raw_h
-                    elif align_mode == "rb":
-                        ax, ay = x_pos + sw - tile.raw_w, y_pos + sh - tile.raw_h
-                    canvas_drawer = Drawer(canvas)
-                    canvas_drawer.paste(img, (ax, ay), with_alpha=True)
+                    if tile.raw_w == sw:
+                        kind = "w"
+                    elif tile.raw_h == sh:
+                        kind = "h"
+                    else:
+                        kind = "corner"
+                    direction = _AUTO_ALIGN[kind][edge_mask]
+
+                    if direction is not None:
+                        tile = tile._replace(
+                            align_mode="auto", align_direction=direction
+                        )
+                        all_tiles[-1] = tile
 
-                    print(
-                        f"Tile {tile.file_name}: {_G}auto aligned to {direction}{_0} ({tile.raw_w}x{tile.raw_h})"
-                    )
-                else:
-                    tile = tile._replace(align_mode="manual", align_direction="lt")
-                    all_tiles[-1] = tile
-                    manual_tiles.append(tile)
-                    print(
-                        f"Tile {tile.file_name}: {_Y}requires manual alignment{_0} ({tile.raw_w}x{tile.raw_h})"
-                    )
+                        ax, ay = _align_xy(
+                            direction, x_pos, y_pos, tile.raw_w, tile.raw_h
+                        )
+                        # Keep paste order: pending standard tiles go first
+                        self._blend_standard_tiles(canvas, pending_std)
+                        canvas_drawer.paste(img, (ax, ay), with_alpha=True)
+                        self._canvas_rev += 1
 
-            progress = (step + 1) / total_steps
-            cv2.imshow(
-                self.window_name,
-                self._render_canvas(canvas, manual_tiles, max_x, max_y, name, progress),
-            )
-            cv2.waitKey(1)
+                        print(
+                            f"Tile {tile.file_name}: {_G}auto aligned to {direction}{_0} ({tile.raw_w}x{tile.raw_h})"
+                        )
+                    else:
+                        tile = tile._replace(align_mode="manual", align_direction="lt")
+                        all_tiles[-1] = tile
+                        manual_tiles.append(tile)
+                        print(
+                            f"Tile {tile.file_name}: {_Y}requires manual alignment{_0} ({tile.raw_w}x{tile.raw_h})"
+                        )
+
+                # Throttle preview updates; always show the last tile
+                now = time.monotonic()
+                if now - last_render >= _PREVIEW_INTERVAL or step == total_steps - 1:
+                    last_render = now
+                    self._blend_standard_tiles(canvas, pending_std)
+                    progress = (step + 1) / total_steps
+                    cv2.imshow(
+                        self.window_name,
+                        self._render_canvas(
+                            canvas, manual_tiles, max_x, max_y, name, progress
+                        ),
+                    )
+                    cv2.waitKey(1)
+        self._blend_standard_tiles(canvas, pending_std)
 
         # Manual adjustment phase
         if not manual_tiles:
@@ -512,9 +748,15 @@ class MergeMapPage:
         # Save the final merged map
         new_w = int(canvas_w * default_config.scale)
         new_h = int(canvas_h * default_config.scale)
-        scaled = cv2.resize(canvas, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        scaled = cv2.resize(
+            canvas,
+            (new_w, new_h),
+            dst=self._scratch("scaled", (new_h, new_w, 4)),
+            interpolation=cv2.INTER_LINEAR,
+        )
 
-        final_bg = np.zeros((new_h, new_w, 4), dtype=np.uint8)
+        final_bg = self._scratch("final", (new_h, new_w, 4))
+        final_bg[:, :, :3] = 0
         final_bg[:, :, 3] = 255
         bg_drawer = Drawer(final_bg)
         bg_drawer.paste(scaled, (0, 0), with_alpha=True)
@@ -538,6 +780,7 @@ class MergeMapPage:
             def __init__(self, parent):
                 self.parent = parent
                 self.tiles_list = manual_tiles
+                self.dirty = False
 
             def handle_click(self, event, x, y, flags, param):
                 if event != cv2.EVENT_LBUTTONDOWN:
@@ -571,6 +814,7 @@ class MergeMapPage:
                         idx = modes.index(current_mode)
                         new_mode = modes[(idx + 1) % 4]
                         self.tiles_list[i] = tile._replace(align_direction=new_mode)
+                        self.dirty = True
                         print(
                             f"Tile {tile.file_name}: {_C}Changed alignment {current_mode} -> {new_mode}{_0}"
                         )
@@ -590,44 +834,29 @@ class MergeMapPage:
             self._render_canvas(canvas, manual_tiles, max_x, max_y, name, 1.0),
         )
 
-        # Wait for user input
+        # Wait for user input, redrawing only after the alignment changed
         while True:
-            key = cv2.waitKey(1) & 0xFF
+            key = cv2.waitKey(30) & 0xFF
             if key == 13:  # ENTER
                 break
             if key == 27:  # ESC
                 break
             if cv2.getWindowProperty(self.window_name, cv2.WND_PROP_VISIBLE) < 1:
                 break
-            cv2.imshow(
-                self.window_name,
-                self._render_canvas(canvas, manual_tiles, max_x, max_y, name, 1.0),
-            )
+            if handler.dirty:
+                handler.dirty = False
+                cv2.imshow(
+                    self.window_name,
+                    self._render_canvas(canvas, manual_tiles, max_x, max_y, name, 1.0),
+                )
 
         # Apply final manual alignments to canvas
-        for tile in manual_tiles:
-            mode = tile.align_direction
-            x_pos = (
-                (max_x - tile.file_x) * default_config.force_size[0]
-                if default_config.flip_x
-                else (tile.file_x - 1) * default_config.force_size[0]
-            )
-            y_pos = (
-                (max_y - tile.file_y) * default_config.force_size[1]
-                if default_config.flip_y
-                else (tile.file_y - 1) * default_config.force_size[1]
-            )
-            sw, sh = default_config.force_size
-            if mode == "lt":
-                ax, ay = x_pos, y_pos
-            elif mode == "rt":
-                ax, ay = x_pos + sw - tile.raw_w, y_pos
-            elif mode == "lb":
-                ax, ay = x_pos, y_pos + sh - tile.raw_h
-            elif mode == "rb":
-                ax, ay = x_pos + sw - tile.raw_w, y_pos + sh - tile.raw_h
-            canvas_drawer = Drawer(canvas)
-            canvas_drawer.paste(tile.raw_img, (ax, ay), with_alpha=True)
+        canvas_drawer = Drawer(canvas)
+        if manual_tiles:
+            pos = _aligned_positions(manual_tiles, max_x, max_y)
+            for tile, (ax, ay) in zip(manual_tiles, pos.tolist()):
+                canvas_drawer.paste(tile.raw_img, (ax, ay), with_alpha=True)
+            self._canvas_rev += 1
 
         # Remove the mouse callback for the next group
         try:
@@ -676,7 +905,7 @@ class DistinMapPage:
         Images are immediately converted to 3-channel BGR so all downstream
         code can assume a uniform (H, W, 3) uint8 format.
         """
-        maps: Dict[str, np.ndarray] = {}
+        names: List[str] = []
         for fname in sorted(os.listdir(self.input_dir)):
             if not fname.endswith(".png"):
                 continue
@@ -688,17 +917,26 @@ class DistinMapPage:
                 continue
             if parsed.map_type != "normal":
                 continue
-            name = fname[:-4]
-            path = os.path.join(self.input_dir, fname)
+            names.append(fname[:-4])
+
+        def load(name: str) -> np.ndarray | None:
+            path = os.path.join(self.input_dir, f"{name}.png")
             img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
             if img is None:
-                continue
+                return None
             # Normalise to 3-channel BGR regardless of source format
             if img.ndim == 2:
                 img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
             elif img.shape[2] == 4:
                 img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-            maps[name] = img
+            return img
+
+        # PNG decoding releases the GIL, so a thread pool scales with cores
+        maps: Dict[str, np.ndarray] = {}
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as ex:
+            for name, img in zip(names, ex.map(load, names)):
+                if img is not None:
+                    maps[name] = img
         return maps
 
     def _copy_tier_maps(self) -> None:
@@ -726,17 +964,26 @@ class DistinMapPage:
 
     @staticmethod
     def _content_mask(img: np.ndarray) -> np.ndarray:
-        """Binary mask of land pixels (gray > 1)."""
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        """Binary mask of land pixels (gray > 1).
+        Dispatches on the channel layout so gray inputs skip the conversion
+        and BGRA inputs are converted without an intermediate BGR copy."""
+        if img.ndim == 2:
+            return img > 1
+        if img.shape[2] == 4:
+            gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
+        else:
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         return gray > 1
 
     @staticmethod
     def _content_bbox(mask: np.ndarray) -> Tuple[int, int, int, int] | None:
         """Return (x1, y1, x2, y2) bounding box of True pixels, or None."""
-        ys, xs = np.nonzero(mask)
-        if len(ys) == 0:
-            return None
-        return int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1
+        return _mask_bbox(mask)
+
+    @staticmethod
+    def _integral_sum(ii: np.ndarray, x1: int, y1: int, x2: int, y2: int) -> int:
+        """Sum of the source image over [x1, x2) x [y1, y2) from its integral image."""
+        return int(ii[y2, x2] - ii[y1, x2] - ii[y2, x1] + ii[y1, x1])
 
     def _match_pair(
         self,
@@ -751,6 +998,8 @@ class DistinMapPage:
 
         Optimized with:
         - Content bounding box pruning (skip offsets with no content overlap)
+        - Integral image pruning (skip offsets where either side has too little
+          content in the overlap to possibly reach min_content)
         - Full-resolution grayscale matching
         """
         h_a, w_a = img_a.shape[:2]
@@ -772,6 +1021,10 @@ class DistinMapPage:
         ax1, ay1, ax2, ay2 = bbox_a
         bx1, by1, bx2, by2 = bbox_b
 
+        # Integral images of the masks give per-candidate content counts in O(1)
+        ii_a = cv2.integral(mask_a.astype(np.uint8))
+        ii_b = cv2.integral(mask_b.astype(np.uint8))
+
         # Precompute grayscale images
         gray_a = cv2.cvtColor(img_a, cv2.COLOR_BGR2GRAY)
         gray_b = cv2.cvtColor(img_b, cv2.COLOR_BGR2GRAY)
@@ -799,10 +1052,18 @@ class DistinMapPage:
                 if ow <= 0 or oh <= 0:
                     continue
 
+                fbx1, fby1 = ox1 - dx, oy1 - dy
+
+                # --- Pruning: n_both can never exceed either side's content ---
+                n_a = self._integral_sum(ii_a, ox1, oy1, ox2, oy2)
+                if n_a < min_content:
+                    continue
+                n_b = self._integral_sum(ii_b, fbx1, fby1, fbx1 + ow, fby1 + oh)
+                if n_b < min_content:
+                    continue
+
                 ra = gray_a[oy1:oy2, ox1:ox2]
                 ma = mask_a[oy1:oy2, ox1:ox2]
-
-                fbx1, fby1 = ox1 - dx, oy1 - dy
                 rb = gray_b[fby1 : fby1 + oh, fbx1 : fbx1 + ow]
                 mb = mask_b[fby1 : fby1 + oh, fbx1 : fbx1 + ow]
 
@@ -811,20 +1072,38 @@ class DistinMapPage:
                 if n_both < min_content:
                     continue
 
-                diff = np.abs(ra.astype(np.int16) - rb.astype(np.int16))
-                score = 1.0 - np.mean(diff[both]) / 255.0
+                # Integer SAD over the shared content, one float divide at the end
+                diff = cv2.absdiff(ra, rb)
+                masked = cv2.bitwise_and(diff, diff, mask=both.view(np.uint8))
+                sad_sum = int(cv2.sumElems(masked)[0])
+                score = 1.0 - sad_sum * _INV_255 / n_both
 
                 if score > threshold and (best is None or score > best[2]):
                     best = (dx, dy, score)
 
         return best
 
-    def _build_layout(self, maps: Dict[str, np.ndarray]) -> Dict[str, Tuple[int, int]]:
-        """Find pairwise overlaps and compute global positions via BFS."""
+    def _build_layout(
+        self, maps: Dict[str, np.ndarray], check_redundant: bool = False
+    ) -> Dict[str, Tuple[int, int]]:
+        """Find pairwise overlaps and compute global positions via BFS.
+
+        Matched maps are merged in a union-find structure; pairs whose maps are
+        already connected are skipped, since their relative offset is fixed by
+        existing edges. Pass check_redundant=True to match every pair anyway.
+        """
         names = list(maps.keys())
         n = len(names)
         masks = {nm: self._content_mask(img) for nm, img in maps.items()}
 
+        parent = list(range(n))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
         edges: Dict[str, List[Tuple[str, int, int]]] = {nm: [] for nm in names}
         total = n * (n - 1) // 2
         idx = 0
@@ -839,12 +1118,17 @@ class DistinMapPage:
                     end="",
                     flush=True,
                 )
+                root_a, root_b = find(i), find(j)
+                if root_a == root_b and not check_redundant:
+                    print(f"{_A}already connected{_0}")
+                    continue
                 result = self._match_pair(maps[na], masks[na], maps[nb], masks[nb])
                 if result:
                     dx, dy, sc = result
                     print(f"{_G}matched{_0}  offset=({dx},{dy})  score={sc:.4f}")
                     edges[na].append((nb, dx, dy))
                     edges[nb].append((na, -dx, -dy))
+                    parent[root_b] = root_a
                 else:
                     print(f"{_A}no overlap{_0}")
 
@@ -899,13 +1183,6 @@ class DistinMapPage:
         except ValueError:
             return name
 
-    def _make_land_alpha(self, img: np.ndarray) -> np.ndarray:
-        """Return a copy of img with non-land pixels set to alpha=0.
-        Prevents black backgrounds from erasing other maps during compositing."""
-        out = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
-        out[~self._content_mask(img), 3] = 0
-        return out
-
     def _composite_canvas(
         self,
         maps: Dict[str, np.ndarray],
@@ -913,13 +1190,17 @@ class DistinMapPage:
         canvas_h: int,
         canvas_w: int,
     ) -> np.ndarray:
-        """Composite all maps onto a blank BGRA canvas and return it."""
-        canvas = np.zeros((canvas_h, canvas_w, 4), dtype=np.uint8)
-        canvas[:, :, 3] = 255
-        drawer = Drawer(canvas)
+        """Composite all maps onto a blank BGR canvas and return it.
+        Land pixels overwrite the canvas directly; non-land pixels are skipped
+        so black backgrounds do not erase other maps."""
+        canvas = np.zeros((canvas_h, canvas_w, 3), dtype=np.uint8)
         for nm in sorted(positions, key=lambda n: positions[n]):
             x, y = positions[nm]
-            drawer.paste(self._make_land_alpha(maps[nm]), (x, y), with_alpha=True)
+            img = maps[nm]
+            h, w = img.shape[:2]
+            region = canvas[y : y + h, x : x + w]
+            land = self._content_mask(img)
+            region[land] = img[land]
         return canvas
 
     def _stitch_group(self, group_key: str, maps: Dict[str, np.ndarray]) -> None:
@@ -1085,6 +1366,9 @@ class DistinMapPage:
         drawing = [False]
         erasing = [False]
         last_pt: List[Tuple[int, int] | None] = [None]
+        # Stroke segments (value, p0, p1) buffered by the mouse callback and
+        # rasterized into barrier once per displayed frame
+        pending_segments: List[Tuple[int, Tuple[int, int], Tuple[int, int]]] = []
         scale_ref = [1.0]
         offset_ref: List[Tuple[int, int]] = [(0, 0)]
 
@@ -1093,28 +1377,36 @@ class DistinMapPage:
             ox, oy = offset_ref[0]
             return int((mx - ox) / s), int((my - oy) / s)
 
+        def flush_segments() -> None:
+            for value, p0, p1 in pending_segments:
+                cv2.line(barrier, p0, p1, value, 3)
+            pending_segments.clear()
+
         def mouse_cb(event, mx, my, flags, _param):
             cx, cy = to_canvas_pt(mx, my)
             if event == cv2.EVENT_LBUTTONDOWN:
                 drawing[0] = True
                 last_pt[0] = (cx, cy)
+                flush_segments()
                 cv2.circle(barrier, (cx, cy), 1, 1, -1)
             elif event == cv2.EVENT_RBUTTONDOWN:
                 erasing[0] = True
                 last_pt[0] = (cx, cy)
+                flush_segments()
                 cv2.circle(barrier, (cx, cy), 1, 0, -1)
             elif event == cv2.EVENT_MOUSEMOVE:
                 if drawing[0] and last_pt[0]:
-                    cv2.line(barrier, last_pt[0], (cx, cy), 1, 3)
+                    pending_segments.append((1, last_pt[0], (cx, cy)))
                     last_pt[0] = (cx, cy)
                 elif erasing[0] and last_pt[0]:
-                    cv2.line(barrier, last_pt[0], (cx, cy), 0, 3)
+                    pending_segments.append((0, last_pt[0], (cx, cy)))
                     last_pt[0] = (cx, cy)
             elif event in (cv2.EVENT_LBUTTONUP, cv2.EVENT_RBUTTONUP):
                 drawing[0] = erasing[0] = False
                 last_pt[0] = None
 
         def make_display() -> np.ndarray:
+            flush_segments()
             vis = canvas[:, :, :3].astype(np.float32)
             vis[overlap] = (
                 vis[overlap] * 0.35 + np.array([0, 140, 255], np.float32) * 0.65
@@ -1166,6 +1458,7 @@ class DistinMapPage:
                 break
         if cv2.getWindowProperty(win, cv2.WND_PROP_VISIBLE) >= 1:
             cv2.destroyWindow(win)
+        flush_segments()
 
         # ------------------------------------------------------------------
         # Step 3: Barrier-aware label-then-assign
@@ -1315,13 +1608,12 @@ class DistinMapPage:
 
         for i, nm in enumerate(names_list):
             mask = ownership_masks[i]  # uint8, 0/1
-            ys, xs = np.nonzero(mask)
-            if len(ys) == 0:
+            bbox = _mask_bbox(mask)
+            if bbox is None:
                 print(f"    {_Y}{nm}: no pixels assigned, skipped{_0}")
                 continue
 
-            y1, y2 = int(ys.min()), int(ys.max()) + 1
-            x1, x2 = int(xs.min()), int(xs.max()) + 1
+            x1, y1, x2, y2 = bbox
 
             # Build this map's full-canvas image from its original data
             img = maps[nm]
@@ -1388,9 +1680,10 @@ class DistinMapPage:
 
         # Label each region with its map name
         for i, nm in enumerate(names_list):
-            ys2, xs2 = np.nonzero(ownership_masks[i])
-            if len(ys2):
-                cy_lbl, cx_lbl = int(ys2.mean()), int(xs2.mean())
+            moments = cv2.moments(ownership_masks[i], binaryImage=True)
+            if moments["m00"] > 0:
+                cx_lbl = int(moments["m10"] / moments["m00"])
+                cy_lbl = int(moments["m01"] / moments["m00"])
                 cv2.putText(
                     overview,
                     nm,
@@ -1447,33 +1740,37 @@ def generate_map_bbox_json(input_dir: str) -> str:
     results: Dict[str, List[int]] = {}
     threshold = 0.05 * 255.0
 
+    img_paths: List[str] = []
     for root, _, files in os.walk(input_dir):
         for file in files:
             if not file.endswith(".png"):
                 continue
             if file.startswith("_"):
                 continue
-            map_name = os.path.splitext(file)[0]
-            img_path = os.path.join(root, file)
-            img = cv2.imread(img_path, cv2.IMREAD_UNCHANGED)
-            if img is None:
-                continue
+            img_paths.append(os.path.join(root, file))
 
-            if img.ndim == 2:
-                rgb = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
-            elif img.shape[2] >= 3:
-                rgb = img[:, :, :3]
-            else:
-                continue
+    def compute_bbox(img_path: str) -> Tuple[int, int, int, int] | None:
+        img = cv2.imread(img_path, cv2.IMREAD_UNCHANGED)
+        if img is None:
+            return None
 
-            brightness = np.mean(rgb, axis=2)
-            ys, xs = np.where(brightness > threshold)
-            if len(ys) == 0 or len(xs) == 0:
-                continue
+        if img.ndim == 2:
+            rgb = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        elif img.shape[2] >= 3:
+            rgb = img[:, :, :3]
+        else:
+            return None
 
-            min_x, max_x = int(xs.min()), int(xs.max())
-            min_y, max_y = int(ys.min()), int(ys.max())
-            results[map_name] = [min_x, min_y, max_x + 1, max_y + 1]
+        # Compare channel sums against 3x threshold to stay in integer math
+        brightness_sum = rgb.sum(axis=2, dtype=np.uint16)
+        return _mask_bbox(brightness_sum > int(threshold * 3))
+
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as ex:
+        for img_path, bbox in zip(img_paths, ex.map(compute_bbox, img_paths)):
+            if bbox is None:
+                continue
+            map_name = os.path.splitext(os.path.basename(img_path))[0]
+            results[map_name] = list(bbox)
 
     output_path = os.path.join(input_dir, "map_bbox.json")
     with open(output_path, "w", encoding="utf-8") as f:
@@ -1,16 +1,25 @@
 import argparse
+import functools
 import os
+import re
 import sys
 import shutil
+import stat
 import subprocess
 import platform
 import traceback
 import urllib.request
 import urllib.error
 import json
+import tarfile
 import tempfile
-from pathlib import Path
+import zipfile
+import threading
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path, PurePosixPath
 import time
+from types import MappingProxyType
+from typing import Callable
 
 from cli_support import Console, init_localization
 
@@ -19,6 +28,29 @@ PROJECT_BASE: Path = Path(__file__).parent.parent.resolve()
 MFW_REPO: str = "MaaXYZ/MaaFramework"
 MXU_REPO: str = "MistEO/MXU"
 MAAEND_REPO: str = "MaaEnd/MaaEnd"
+GITHUB_TOKEN: str | None = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+
+
+def _lstat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return os.lstat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _is_link(st: os.stat_result) -> bool:
+    """判断 lstat 结果是否为符号链接或 Windows Junction"""
+    return stat.S_ISLNK(st.st_mode) or (
+        getattr(st, "st_reparse_tag", 0) == getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", -1)
+    )
+
+
+def _is_non_empty_dir(path: Path) -> bool:
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except OSError:
+        return False
 
 
 def create_directory_link(src: Path, dst: Path) -> bool:
@@ -27,8 +59,10 @@ def create_directory_link(src: Path, dst: Path) -> bool:
     - Windows：Junction
     - Unix/macOS：symlink
     """
-    if dst.exists() or dst.is_symlink():
-        if dst.is_dir() and not dst.is_symlink():
+    dst_st = _lstat_or_none(dst)
+    if dst_st is not None:
+        # lstat 不跟随链接：只有真实目录（含 Junction）才是 S_IFDIR
+        if stat.S_ISDIR(dst_st.st_mode):
             try:
                 dst.rmdir()
             except OSError:
@@ -38,14 +72,14 @@ def create_directory_link(src: Path, dst: Path) -> bool:
 
     dst.parent.mkdir(parents=True, exist_ok=True)
 
-    if platform.system() == "Windows":
+    if _SYSTEM == "windows":
         result = subprocess.run(
             ["cmd", "/c", "mklink", "/J", str(dst), str(src)],
             capture_output=True,
             text=True,
         )
         if result.returncode != 0:
-            print(Console.err(t("err_create_junction_failed", stderr=result.stderr)))
+            print_line(Console.err(t("err_create_junction_failed", stderr=result.stderr)))
             return False
     else:
         dst.symlink_to(src)
@@ -62,43 +96,55 @@ def init_local() -> None:
     global _local_t
     t_func, load_error_path = init_localization(LOCALS_DIR)
     _local_t = t_func
+    _t_static.cache_clear()
     if load_error_path:
         print(Console.err(t("error_load_locale", path=load_error_path)))
 
 
+@functools.lru_cache(maxsize=256)
+def _t_static(key: str) -> str:
+    return _local_t(key)
+
+
 def t(key: str, **kwargs) -> str:
+    # 无参数的文本不需要格式化，缓存查找结果
+    if not kwargs:
+        return _t_static(key)
     return _local_t(key, **kwargs)
 
 
+_SYSTEM: str = platform.system().lower()
+_MACHINE: str = platform.machine().lower()
+
+OS_KEYWORDS: MappingProxyType[str, str] = MappingProxyType({
+    "windows": "win",
+    "linux": "linux",
+    "darwin": "macos",
+})
+ARCH_KEYWORDS: MappingProxyType[str, str] = MappingProxyType({
+    "amd64": "x86_64",
+    "x86_64": "x86_64",
+    "aarch64": "aarch64",
+    "arm64": "aarch64",
+})
+MFW_DIST_NAMES: MappingProxyType[str, str] = MappingProxyType({
+    "win": "MaaFramework.dll",
+    "linux": "libMaaFramework.so",
+    "macos": "libMaaFramework.dylib",
+})
+
 try:
-    OS_KEYWORD: str = {
-        "windows": "win",
-        "linux": "linux",
-        "darwin": "macos",
-    }[platform.system().lower()]
+    OS_KEYWORD: str = OS_KEYWORDS[_SYSTEM]
 except KeyError as e:
-    raise RuntimeError(
-        f"Unrecognized operating system: {platform.system().lower()}"
-    ) from e
+    raise RuntimeError(f"Unrecognized operating system: {_SYSTEM}") from e
 
 try:
-    ARCH_KEYWORD: str = {
-        "amd64": "x86_64",
-        "x86_64": "x86_64",
-        "aarch64": "aarch64",
-        "arm64": "aarch64",
-    }[platform.machine().lower()]
+    ARCH_KEYWORD: str = ARCH_KEYWORDS[_MACHINE]
 except KeyError as e:
-    raise RuntimeError(
-        f"Unrecognized architecture: {platform.machine().lower()}"
-    ) from e
+    raise RuntimeError(f"Unrecognized architecture: {_MACHINE}") from e
 
 try:
-    MFW_DIST_NAME: str = {
-        "win": "MaaFramework.dll",
-        "linux": "libMaaFramework.so",
-        "macos": "libMaaFramework.dylib",
-    }[OS_KEYWORD]
+    MFW_DIST_NAME: str = MFW_DIST_NAMES[OS_KEYWORD]
 except KeyError as e:
     raise RuntimeError(f"Unsupported OS for MaaFramework: {OS_KEYWORD}") from e
 
@@ -109,14 +155,41 @@ ARCH_VARIANT_HINTS: dict[str, tuple[str, ...]] = {
     "aarch64": ("aarch64", "arm64"),
 }
 TIMEOUT: int = 30
+# 网关错误与连接失败时按指数退避重试
+HTTP_RETRIES: int = 3
+HTTP_RETRY_BACKOFF: float = 0.5
+HTTP_RETRY_STATUS: frozenset[int] = frozenset({502, 503, 504})
+DOWNLOAD_BLOCK_SIZE: int = 256 * 1024
+EXTRACT_BLOCK_SIZE: int = 1024 * 1024
+# 大归档按成员分组多线程解压
+PARALLEL_EXTRACT_MIN_SIZE: int = 32 * 1024 * 1024
+EXTRACT_WORKERS: int = min(8, os.cpu_count() or 1)
+# 大文件拆分为多个 Range 请求并发下载
+DOWNLOAD_SEGMENTS: int = 4
+SEGMENTED_DOWNLOAD_MIN_SIZE: int = 16 * 1024 * 1024
+PROGRESS_INTERVAL: float = 0.25
 CACHE_DIR: Path = PROJECT_BASE / ".cache"
+MODEL_PATH: Path = PROJECT_BASE / "assets" / "resource" / "model"
+MAAUTILS_DIR: Path = PROJECT_BASE / "agent" / "cpp-algo" / "MaaUtils"
+MAAUTILS_CMAKE: Path = MAAUTILS_DIR / "MaaUtils.cmake"
+MAADEPS_INSTALLED_DIR: Path = MAAUTILS_DIR / "MaaDeps" / "vcpkg" / "installed"
+MAADEPS_DOWNLOAD_SCRIPT: Path = PROJECT_BASE / "tools" / "maadeps-download.py"
+BUILD_SCRIPT_PATH: Path = PROJECT_BASE / "tools" / "build_and_install.py"
+MAAFW_DEPS: Path = PROJECT_BASE / "deps"
+# GitHub Releases API 响应缓存，过期后使用 ETag 条件请求重新验证
+RELEASES_CACHE_DIR: Path = CACHE_DIR / "gh_releases"
+RELEASES_CACHE_TTL: int = 24 * 3600
+# 包含预发布版本时只拉取最近的若干个 Release
+RELEASES_PER_PAGE: int = 10
 VERSION_FILE_NAME: str = "version.json"
 
+# 依赖并发安装时串行化控制台输出；交互提示期间持有，其他安装任务的输出随之暂停
+_STDOUT_LOCK = threading.Lock()
+
 
 def configure_token() -> None:
     """配置 GitHub Token，输出检测结果"""
-    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
-    if token:
+    if GITHUB_TOKEN:
         print(Console.ok(t("inf_github_token_configured")))
     else:
         print(Console.warn(t("wrn_github_token_not_configured")))
@@ -124,6 +197,24 @@ def configure_token() -> None:
     print("-" * 40)
 
 
+def ask_retry() -> bool:
+    """提示用户重试或退出，返回是否重试"""
+    with _STDOUT_LOCK:
+        return input(t("prompt_retry_or_quit")).strip().lower() != "q"
+
+
+def print_line(*values, sep: str = " ", end: str = "\n") -> None:
+    """同 print，但连同换行符一次写出并刷新，依赖并发安装时各行不会交错"""
+    text = sep.join(map(str, values)) + end
+    with _STDOUT_LOCK:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def _discard(*args, **kwargs) -> None:
+    """丢弃输出，用于后台静默执行时替代 print"""
+
+
 def run_command(
     cmd: list[str] | str, cwd: Path | str | None = None, shell: bool = False
 ) -> bool:
@@ -143,7 +234,7 @@ def update_submodules(skip_if_exist: bool = True) -> bool:
     print(Console.hdr(t("inf_check_submodules")))
 
     # 兼容旧版本：model 可能是普通文件夹而非子模块，需要删除以确保子模块正常 clone
-    model_path = PROJECT_BASE / "assets" / "resource" / "model"
+    model_path = MODEL_PATH
     if model_path.is_dir() and not (model_path / "LICENSE").exists():
         print(Console.warn(t("wrn_model_not_submodule", path=model_path)))
         shutil.rmtree(model_path)
@@ -152,7 +243,7 @@ def update_submodules(skip_if_exist: bool = True) -> bool:
     if (
         not skip_if_exist
         or not (model_path / "LICENSE").exists()
-        or not (PROJECT_BASE / "agent" / "cpp-algo" / "MaaUtils" / "MaaUtils.cmake").exists()
+        or not MAAUTILS_CMAKE.exists()
     ):
         print(Console.info(t("inf_updating_submodules")))
         return run_command(["git", "submodule", "update", "--init", "--recursive"])
@@ -162,50 +253,169 @@ def update_submodules(skip_if_exist: bool = True) -> bool:
 
 def bootstrap_maadeps(skip_if_exist: bool = True) -> bool:
     """下载 MaaDeps 预编译依赖"""
-    maadeps_dir = (
-        PROJECT_BASE / "agent" / "cpp-algo" / "MaaUtils" / "MaaDeps" / "vcpkg" / "installed"
-    )
-    if skip_if_exist and maadeps_dir.exists() and any(maadeps_dir.iterdir()):
+    if skip_if_exist and _is_non_empty_dir(MAADEPS_INSTALLED_DIR):
         print(Console.ok(t("inf_maadeps_exist")))
         return True
 
     print(Console.info(t("inf_bootstrap_maadeps")))
-    script_path = PROJECT_BASE / "tools" / "maadeps-download.py"
-    return run_command([sys.executable, str(script_path)])
+    return run_command([sys.executable, str(MAADEPS_DOWNLOAD_SCRIPT)])
 
 
 def run_build_script() -> bool:
     print(Console.hdr(t("inf_run_build_script")))
-    script_path = PROJECT_BASE / "tools" / "build_and_install.py"
-    return run_command([sys.executable, str(script_path)])
+    return run_command([sys.executable, str(BUILD_SCRIPT_PATH)])
+
+
+_OPENER = urllib.request.build_opener()
+_OPENER.addheaders = [("User-Agent", "MaaEnd-setup")]
+
+
+def _urlopen(req: urllib.request.Request):
+    """使用共享的 opener 发起请求，遇到网关错误或连接失败时退避重试"""
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            return _OPENER.open(req, timeout=TIMEOUT)
+        except urllib.error.HTTPError as e:
+            if e.code not in HTTP_RETRY_STATUS or attempt == HTTP_RETRIES:
+                raise
+            e.close()
+        except urllib.error.URLError:
+            if attempt == HTTP_RETRIES:
+                raise
+        time.sleep(HTTP_RETRY_BACKOFF * 2**attempt)
+
+
+def _releases_cache_path(key: str) -> Path:
+    return RELEASES_CACHE_DIR / f"{key.replace('/', '_')}.json"
+
+
+def read_releases_cache(key: str) -> dict | None:
+    path = _releases_cache_path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) and "payload" in data else None
+
+
+def write_releases_cache(key: str, cache: dict) -> None:
+    try:
+        RELEASES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_releases_cache_path(key), "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _slim_releases(tags):
+    """仅保留匹配资源所需的字段，缩小缓存文件及后续读取的解析量"""
+    if not isinstance(tags, list):
+        return tags
+    return [
+        {
+            "tag_name": tag.get("tag_name"),
+            "name": tag.get("name"),
+            "prerelease": tag.get("prerelease", False),
+            "draft": tag.get("draft", False),
+            "assets": [
+                {"name": a["name"], "browser_download_url": a["browser_download_url"]}
+                for a in tag.get("assets", [])
+            ],
+        }
+        for tag in tags
+    ]
+
+
+# 本次运行中已获取的 Release 列表，预下载与正式安装共用，不重复请求
+_RELEASES_FETCHED: dict[str, list] = {}
+
+
+def fetch_releases(repo: str, prerelease: bool = True, revalidate: bool = False) -> list:
+    """
+    获取指定 GitHub 仓库的 Release 列表。
+    不需要预发布版本时只请求 /releases/latest，否则只请求最近 RELEASES_PER_PAGE 个 Release。
+
+    响应缓存在 RELEASES_CACHE_DIR 中，TTL 内直接复用；过期或 revalidate 时携带
+    If-None-Match / If-Modified-Since 发起条件请求，304 响应不计入 API 速率限制。
+    同一次运行中每个仓库只获取一次，之后直接返回内存中的结果。
+    """
+    if prerelease:
+        api_url = f"https://api.github.com/repos/{repo}/releases?per_page={RELEASES_PER_PAGE}"
+        cache_key = repo
+    else:
+        api_url = f"https://api.github.com/repos/{repo}/releases/latest"
+        cache_key = f"{repo}@latest"
+
+    if cache_key in _RELEASES_FETCHED:
+        return _RELEASES_FETCHED[cache_key]
+
+    cache = read_releases_cache(cache_key)
+    if (
+        cache
+        and not revalidate
+        and time.time() - cache.get("fetched_at", 0) < RELEASES_CACHE_TTL
+    ):
+        _RELEASES_FETCHED[cache_key] = cache["payload"]
+        return cache["payload"]
+
+    req = urllib.request.Request(api_url)
+    if GITHUB_TOKEN:
+        req.add_header("Authorization", f"Bearer {GITHUB_TOKEN}")
+    req.add_header("Accept", "application/vnd.github+json")
+    req.add_header("X-GitHub-Api-Version", "2022-11-28")
+    if cache:
+        if cache.get("etag"):
+            req.add_header("If-None-Match", cache["etag"])
+        if cache.get("last_modified"):
+            req.add_header("If-Modified-Since", cache["last_modified"])
+
+    try:
+        with _urlopen(req) as res:
+            # json.loads 直接接受 bytes，省去一次完整的解码拷贝
+            tags = json.loads(res.read())
+            if isinstance(tags, dict):
+                tags = [tags]
+            tags = _slim_releases(tags)
+            cache = {
+                "etag": res.headers.get("ETag"),
+                "last_modified": res.headers.get("Last-Modified"),
+                "payload": tags,
+            }
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not cache:
+            raise
+        tags = cache["payload"]
+
+    cache["fetched_at"] = time.time()
+    write_releases_cache(cache_key, cache)
+    _RELEASES_FETCHED[cache_key] = tags
+    return tags
 
 
 def get_latest_release_url(
-    repo: str, keywords: list[str], prerelease: bool = True
+    repo: str,
+    keywords: list[str],
+    prerelease: bool = True,
+    revalidate: bool = False,
+    quiet: bool = False,
 ) -> tuple[str | None, str | None, str | None]:
     """
     获取指定 GitHub 仓库 Release 中首个符合是否预发布要求，且匹配所有关键字的资源下载链接和文件名。
+    revalidate 为 True 时忽略缓存 TTL，向 GitHub 确认 Release 列表是否有更新。
+    quiet 为 True 时不输出任何信息，失败仅以返回值体现。
 
     https://docs.github.com/en/rest/releases/releases?apiVersion=2022-11-28#list-releases
+    https://docs.github.com/en/rest/releases/releases?apiVersion=2022-11-28#get-the-latest-release
     """
-    api_url = f"https://api.github.com/repos/{repo}/releases"
-    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
-
+    echo = _discard if quiet else print_line
     try:
-        print(Console.info(t("inf_get_latest_release", repo=repo)))
-
-        req = urllib.request.Request(api_url)
-        if token:
-            req.add_header("Authorization", f"Bearer {token}")
-        req.add_header("Accept", "application/vnd.github+json")
-        req.add_header("User-Agent", "MaaEnd-setup")
-        req.add_header("X-GitHub-Api-Version", "2022-11-28")
+        echo(Console.info(t("inf_get_latest_release", repo=repo)))
 
-        with urllib.request.urlopen(req, timeout=TIMEOUT) as res:
-            tags = json.loads(res.read().decode())
-            assert isinstance(tags, list)
-            if not tags:
-                raise ValueError("No releases found (GitHub API)")
+        tags = fetch_releases(repo, prerelease=prerelease, revalidate=revalidate)
+        assert isinstance(tags, list)
+        if not tags:
+            raise ValueError("No releases found (GitHub API)")
 
         for tag in tags:
             assert isinstance(tag, dict)
@@ -222,13 +432,13 @@ def get_latest_release_url(
                 assert isinstance(asset, dict)
                 name = asset["name"].lower()
                 if all(k.lower() in name for k in keywords):
-                    print(Console.ok(t("inf_matched_asset", name=asset["name"])))
+                    echo(Console.ok(t("inf_matched_asset", name=asset["name"])))
                     tag_name = tag.get("tag_name") or tag.get("name")
                     return asset["browser_download_url"], asset["name"], tag_name
 
         raise ValueError("No matching asset found in the latest release (GitHub API)")
     except Exception as e:
-        print(Console.err(t("err_get_release_failed", error_type=type(e).__name__, error=e)))
+        echo(Console.err(t("err_get_release_failed", error_type=type(e).__name__, error=e)))
 
     return None, None, None
 
@@ -258,7 +468,11 @@ def write_versions_file(path: Path, versions: dict[str, str]) -> None:
         print(Console.warn(t("wrn_write_version_failed", error=e)))
 
 
-def parse_semver(version: str) -> tuple[list[int], list[str]]:
+_SEMVER_LEAD_DIGITS = re.compile(r"\d+")
+
+
+@functools.lru_cache(maxsize=64)
+def parse_semver(version: str) -> tuple[tuple[int, ...], tuple[str, ...]]:
     """Parse a semver string into (core_numbers, prerelease_identifiers).
 
     Implements SemVer 2.0.0 precedence essentials used by compare_semver:
@@ -268,7 +482,7 @@ def parse_semver(version: str) -> tuple[list[int], list[str]]:
     - Handle prerelease precedence (alpha/beta/rc, numeric identifiers, etc.)
     """
     if not version:
-        return [], []
+        return (), ()
 
     v = version.strip()
     if v.startswith(("v", "V")):
@@ -282,19 +496,16 @@ def parse_semver(version: str) -> tuple[list[int], list[str]]:
     core_part, pre_part = (v.split("-", 1) + [""])[:2] if "-" in v else (v, "")
 
     def parse_core_number(part: str) -> int:
-        num = ""
-        for ch in part:
-            if ch.isdigit():
-                num += ch
-            else:
-                break
-        return int(num) if num else 0
+        m = _SEMVER_LEAD_DIGITS.match(part)
+        return int(m.group()) if m else 0
 
-    core_numbers = [parse_core_number(p) for p in core_part.split(".") if p != ""]
-    prerelease = [p for p in pre_part.split(".") if p != ""] if pre_part else []
+    # 结果会被缓存，返回不可变的元组
+    core_numbers = tuple(parse_core_number(p) for p in core_part.split(".") if p != "")
+    prerelease = tuple(p for p in pre_part.split(".") if p != "") if pre_part else ()
     return core_numbers, prerelease
 
 
+@functools.lru_cache(maxsize=64)
 def compare_semver(a: str | None, b: str | None) -> int:
     if not a and not b:
         return 0
@@ -306,15 +517,12 @@ def compare_semver(a: str | None, b: str | None) -> int:
     left_core, left_pre = parse_semver(a or "")
     right_core, right_pre = parse_semver(b or "")
 
-    # Compare major.minor.patch (or longer) numerically.
+    # Compare major.minor.patch (or longer) numerically, as padded tuples.
     max_len = max(len(left_core), len(right_core))
-    left_core += [0] * (max_len - len(left_core))
-    right_core += [0] * (max_len - len(right_core))
-    for l, r in zip(left_core, right_core):
-        if l > r:
-            return 1
-        if l < r:
-            return -1
+    left_core += (0,) * (max_len - len(left_core))
+    right_core += (0,) * (max_len - len(right_core))
+    if left_core != right_core:
+        return (left_core > right_core) - (left_core < right_core)
 
     # Core equal: version without prerelease has higher precedence.
     if not left_pre and not right_pre:
@@ -364,16 +572,17 @@ def ensure_cache_dir() -> Path:
     return CACHE_DIR
 
 
-def cleanup_cache_file(path: Path) -> None:
+def cleanup_cache_file(path: Path, quiet: bool = False) -> None:
+    echo = _discard if quiet else print_line
     try:
         if path.exists():
             path.unlink()
-            print(Console.ok(t("inf_cache_cleaned", path=path)))
+            echo(Console.ok(t("inf_cache_cleaned", path=path)))
         meta = Path(str(path) + ".url")
         if meta.exists():
             meta.unlink()
     except OSError as e:
-        print(Console.warn(t("wrn_cache_clean_failed", path=path, error=e)))
+        echo(Console.warn(t("wrn_cache_clean_failed", path=path, error=e)))
 
 
 def clean_cache() -> None:
@@ -382,7 +591,7 @@ def clean_cache() -> None:
         return
     total_size = 0
     count = 0
-    for f in CACHE_DIR.iterdir():
+    for f in CACHE_DIR.rglob("*"):
         if f.is_file():
             total_size += f.stat().st_size
             count += 1
@@ -398,21 +607,147 @@ def clean_cache() -> None:
         print(Console.warn(t("wrn_cache_clean_failed", path=CACHE_DIR, error=e)))
 
 
-def download_file(url: str, dest_path: Path, resume: bool = False) -> bool:
-    """下载文件到指定路径。"""
+# 后台静默下载的 {目标路径: (已接收, 总大小)}，供主线程等待时汇总显示进度
+_BACKGROUND_PROGRESS: dict[Path, tuple[int, int]] = {}
 
-    def to_percentage(current: float, total: float) -> str:
-        return f"{(current / total) * 100:.1f}%" if total > 0 else ""
 
-    def to_file_size(size: int | None) -> str:
-        if size is None or size < 0:
-            return "--"
-        s = float(size)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if s < 1024.0 or unit == "TB":
-                return f"{s:.1f} {unit}"
-            s /= 1024.0
+def _to_file_size(size: int | None) -> str:
+    if size is None or size < 0:
         return "--"
+    s = float(size)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if s < 1024.0 or unit == "TB":
+            return f"{s:.1f} {unit}"
+        s /= 1024.0
+    return "--"
+
+
+def write_progress(text: str) -> None:
+    """以回车覆盖当前行输出进度；整行一次写出并刷新，多个下载并发时不会交错"""
+    with _STDOUT_LOCK:
+        sys.stdout.write(f"\r{text}")
+        sys.stdout.flush()
+
+
+class _CountingReader:
+    """包装响应对象，统计已读取的字节数；abort 被设置后中止读取"""
+
+    def __init__(self, src, abort: threading.Event):
+        self.count = 0
+        self._src = src
+        self._abort = abort
+
+    def read(self, size: int = -1) -> bytes:
+        if self._abort.is_set():
+            raise InterruptedError("Download aborted")
+        chunk = self._src.read(size)
+        self.count += len(chunk)
+        return chunk
+
+
+def _wait_with_progress(
+    futures: list,
+    abort: threading.Event,
+    get_received: Callable[[], int],
+    on_progress: Callable[[int], None],
+) -> None:
+    """在主线程等待下载任务完成并定时刷新进度，任一任务失败或被中断时通知其余任务中止"""
+    pending = futures
+    try:
+        while pending:
+            done, pending = wait(
+                pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_EXCEPTION
+            )
+            for future in done:
+                future.result()
+            on_progress(get_received())
+    finally:
+        abort.set()
+
+
+def _open_range(url: str, start: int, end: int):
+    """请求 [start, end) 字节范围"""
+    req = urllib.request.Request(url)
+    req.add_header("Range", f"bytes={start}-{end - 1}")
+    return _urlopen(req)
+
+
+def _download_segmented(
+    res, dest_path: Path, size_total: int, on_progress: Callable[[int], None]
+) -> bool:
+    """
+    将完整内容的响应 res 拆分为多个字节范围并发下载到 dest_path。
+    res 负责第一段，其余各段使用 Range 请求。
+    若服务器不支持 Range 则返回 False，此时 res 未被读取，可继续串行下载。
+    """
+    seg_url = res.geturl()
+    span = -(-size_total // DOWNLOAD_SEGMENTS)
+    bounds = [(lo, min(lo + span, size_total)) for lo in range(0, size_total, span)]
+
+    probe = _open_range(seg_url, *bounds[1])
+    if probe.getcode() != 206:
+        probe.close()
+        return False
+
+    lock = threading.Lock()
+    abort = threading.Event()
+    received = 0
+
+    def fetch(start: int, end: int, src=None) -> None:
+        nonlocal received
+        if src is None:
+            src = _open_range(seg_url, start, end)
+            if src.getcode() != 206:
+                src.close()
+                raise ValueError("Server ignored range request")
+        with src, open(dest_path, "r+b") as out_file:
+            out_file.seek(start)
+            remaining = end - start
+            while remaining > 0 and not abort.is_set():
+                chunk = src.read(min(DOWNLOAD_BLOCK_SIZE, remaining))
+                if not chunk:
+                    raise EOFError(f"Segment {start}-{end} ended early")
+                out_file.write(chunk)
+                remaining -= len(chunk)
+                with lock:
+                    received += len(chunk)
+
+    try:
+        # 预分配完整大小，各段直接写入各自偏移
+        with open(dest_path, "wb") as out_file:
+            out_file.truncate(size_total)
+        with ThreadPoolExecutor(max_workers=len(bounds)) as executor:
+            futures = [
+                executor.submit(fetch, *bounds[0], res),
+                executor.submit(fetch, *bounds[1], probe),
+            ]
+            futures += [executor.submit(fetch, *b) for b in bounds[2:]]
+            _wait_with_progress(futures, abort, lambda: received, on_progress)
+    except BaseException:
+        probe.close()
+        # 分段文件中间有空洞，不能用于断点续传
+        dest_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def download_file(
+    url: str,
+    dest_path: Path,
+    resume: bool = False,
+    show_progress: bool = True,
+    quiet: bool = False,
+) -> bool:
+    """
+    下载文件到指定路径。resume 时若缓存文件已完整下载则直接复用。
+    quiet 为 True 时不输出任何信息（包括进度），用于后台预下载。
+    show_progress 为 False 时只输出整行信息，供多个下载并发时使用。
+    """
+    echo = _discard if quiet else print_line
+    show_progress = show_progress and not quiet
+
+    def to_percentage(current: float, total: float) -> str:
+        return f"{(current / total) * 100:.1f}%" if total > 0 else ""
 
     def to_speed(bps: float) -> str:
         if bps is None or bps <= 0:
@@ -436,7 +771,7 @@ def download_file(url: str, dest_path: Path, resume: bool = False) -> bool:
     _retried_416 = False
 
     try:
-        print(Console.info(t("inf_start_download", url=url)))
+        echo(Console.info(t("inf_start_download", url=url)))
 
         url_meta = Path(str(dest_path) + ".url")
 
@@ -447,31 +782,39 @@ def download_file(url: str, dest_path: Path, resume: bool = False) -> bool:
                 except OSError:
                     cached_url = ""
                 if cached_url and cached_url != url:
-                    print(Console.warn(t("wrn_cache_url_mismatch")))
-                    cleanup_cache_file(dest_path)
+                    echo(Console.warn(t("wrn_cache_url_mismatch")))
+                    cleanup_cache_file(dest_path, quiet=quiet)
                     if dest_path.exists():
                         resume = False
+                elif cached_url == url:
+                    # .url 元数据仅在下载完成后写入，说明缓存文件已完整
+                    echo(Console.ok(t("inf_download_cached", path=dest_path)))
+                    return True
+
+        # 下载未完成前不保留元数据，避免将部分下载的文件误认为完整
+        url_meta.unlink(missing_ok=True)
 
         while True:
             existing_size = 0
             if resume and not _retried_416 and dest_path.exists():
                 existing_size = dest_path.stat().st_size
                 if existing_size > 0:
-                    print(Console.info(t("inf_resume_detected", size=to_file_size(existing_size))))
+                    echo(Console.info(t("inf_resume_detected", size=_to_file_size(existing_size))))
 
             req = urllib.request.Request(url)
-            req.add_header("User-Agent", "MaaEnd-setup")
             if existing_size > 0:
                 req.add_header("Range", f"bytes={existing_size}-")
 
-            print(Console.info(t("inf_connecting")), end="", flush=True)
+            # 有进度行时其会接在本行之后覆盖输出；否则整行输出，避免并发时被其他输出接上
+            echo(Console.info(t("inf_connecting")), end="" if show_progress else "\n")
             try:
-                res = urllib.request.urlopen(req, timeout=TIMEOUT)
+                res = _urlopen(req)
             except urllib.error.HTTPError as he:
                 if he.code == 416 and existing_size > 0 and not _retried_416:
-                    print()
+                    if show_progress:
+                        echo()
                     _retried_416 = True
-                    cleanup_cache_file(dest_path)
+                    cleanup_cache_file(dest_path, quiet=quiet)
                     continue
                 raise
 
@@ -491,85 +834,279 @@ def download_file(url: str, dest_path: Path, resume: bool = False) -> bool:
                             size_total = 0
                 file_mode = "ab"
                 size_received = existing_size
-                print(Console.info(
+                echo(Console.info(
                     t("inf_resuming_download",
-                      downloaded=to_file_size(existing_size),
-                      total=to_file_size(size_total))
+                      downloaded=_to_file_size(existing_size),
+                      total=_to_file_size(size_total))
                 ))
             else:
                 size_total = int(res.headers.get("Content-Length", 0) or 0)
                 file_mode = "wb"
                 size_received = 0
                 if existing_size > 0:
-                    print(Console.warn(t("wrn_resume_not_supported")))
+                    echo(Console.warn(t("wrn_resume_not_supported")))
 
-            session_received = 0
-            cached_progress_str = ""
             start_ts = time.time()
+            # 进度行模板只本地化一次，刷新时仅替换占位符
+            progress_line = Console.info(t("inf_downloading", progress="\0"))
+
+            # 调用方已按 PROGRESS_INTERVAL 节流，每次调用直接整行输出
+            def report_progress(size_received: int) -> None:
+                if quiet:
+                    _BACKGROUND_PROGRESS[dest_path] = (size_received, size_total)
+                    return
+                if not show_progress:
+                    return
+                elapsed = max(1e-6, time.time() - start_ts)
+                speed = (size_received - existing_size) / elapsed
+                eta = None
+                if size_total > 0 and speed > 0:
+                    eta = (size_total - size_received) / speed
+
+                progress_str = (
+                    f"{_to_file_size(size_received)}/{_to_file_size(size_total)} "
+                    f"({to_percentage(size_received, size_total)}) | "
+                    f"{to_speed(speed)} | ETA {seconds_to_hms(eta)}"
+                )
 
-            with open(dest_path, file_mode) as out_file:
-                while True:
-                    chunk = res.read(8192)
-                    if not chunk:
-                        break
-                    out_file.write(chunk)
-                    size_received += len(chunk)
-                    session_received += len(chunk)
-
-                    elapsed = max(1e-6, time.time() - start_ts)
-                    speed = session_received / elapsed
-                    eta = None
-                    if size_total > 0 and speed > 0:
-                        eta = (size_total - size_received) / speed
-
-                    progress_str = (
-                        f"{to_file_size(size_received)}/{to_file_size(size_total)} "
-                        f"({to_percentage(size_received, size_total)}) | "
-                        f"{to_speed(speed)} | ETA {seconds_to_hms(eta)}"
-                    )
+                write_progress(progress_line.replace("\0", progress_str))
 
-                    if progress_str != cached_progress_str:
-                        print(
-                            f"\r{Console.info(t('inf_downloading', progress=progress_str))}",
-                            end="",
-                            flush=True,
-                        )
-                        cached_progress_str = progress_str
-        print()
-        print(Console.ok(t("inf_download_complete", path=dest_path)))
+            segmented = (
+                file_mode == "wb"
+                and size_total >= SEGMENTED_DOWNLOAD_MIN_SIZE
+                and res.headers.get("Accept-Ranges", "").lower() == "bytes"
+            )
+            if not (
+                segmented
+                and _download_segmented(res, dest_path, size_total, report_progress)
+            ):
+                # 拷贝在工作线程中进行，进度由主线程定时刷新，不占用读写循环
+                abort = threading.Event()
+                reader = _CountingReader(res, abort)
+
+                def copy_body() -> None:
+                    with open(dest_path, file_mode) as out_file:
+                        shutil.copyfileobj(reader, out_file, DOWNLOAD_BLOCK_SIZE)
+
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    _wait_with_progress(
+                        [executor.submit(copy_body)],
+                        abort,
+                        lambda: size_received + reader.count,
+                        report_progress,
+                    )
+        if show_progress:
+            echo()
+        echo(Console.ok(t("inf_download_complete", path=dest_path)))
         try:
             url_meta.write_text(url, encoding="utf-8")
         except OSError:
             pass
         return True
     except urllib.error.URLError as e:
-        print(Console.err(t("err_network_error", reason=e.reason)))
+        echo(Console.err(t("err_network_error", reason=e.reason)))
     except Exception as e:
-        print(Console.err(t("err_download_failed", error_type=type(e).__name__, error=e)))
+        echo(Console.err(t("err_download_failed", error_type=type(e).__name__, error=e)))
     return False
 
 
+def _find_sdk_prefix(entries) -> str | None:
+    """
+    在归档成员 (名称, 是否目录) 中查找包含 bin 目录的最浅层 SDK 根目录，
+    返回其路径前缀（以 / 结尾，位于归档根目录时为空字符串）。
+    """
+    best: list[str] | None = None
+    for name, is_dir in entries:
+        parts = name.strip("/").split("/")
+        dirs = parts if is_dir else parts[:-1]
+        if "bin" in dirs:
+            root = parts[: dirs.index("bin")]
+            if best is None or len(root) < len(best):
+                best = root
+    return None if best is None else "".join(f"{p}/" for p in best)
+
+
+def _is_unchanged(path: Path, size: int, mtime: float) -> bool:
+    """按大小与修改时间判断已有文件是否与归档成员一致（zip 时间精度为 2 秒）"""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size == size and abs(st.st_mtime - mtime) < 2
+
+
+def _remove_stale(dest: Path, keep: set[str]) -> None:
+    """删除 dest 中不在 keep（相对路径）内的文件与目录"""
+    for root, dirs, files in os.walk(dest, topdown=False):
+        rel_root = PurePosixPath(Path(root).relative_to(dest).as_posix())
+        for name in files:
+            if str(rel_root / name) not in keep:
+                os.remove(os.path.join(root, name))
+        for name in dirs:
+            if str(rel_root / name) not in keep:
+                path = os.path.join(root, name)
+                if os.path.islink(path):
+                    os.unlink(path)
+                else:
+                    os.rmdir(path)
+
+
+def _with_parents(paths: list[str]) -> set[str]:
+    keep = set(paths)
+    for path in paths:
+        keep.update(str(p) for p in PurePosixPath(path).parents)
+    return keep
+
+
+def _safe_member_path(name: str) -> str | None:
+    """规范化归档成员的相对路径，拒绝绝对路径与越出目标目录的路径"""
+    parts = [p for p in name.replace("\\", "/").split("/") if p not in ("", ".")]
+    if not parts or ".." in parts or ":" in parts[0]:
+        return None
+    return "/".join(parts)
+
+
+def _write_zip_members(
+    zf: zipfile.ZipFile, members: list[tuple[zipfile.ZipInfo, Path, float]]
+) -> None:
+    """
+    将 (成员, 目标路径, 修改时间) 写出，父目录须已存在。
+    大归档按压缩后大小均分给多个线程，每个线程各自打开归档；
+    zlib 解压、CRC 计算与文件写入都会释放 GIL，线程即可并行利用多核。
+    """
+    archive = zf.filename
+    workers = min(EXTRACT_WORKERS, len(members))
+    if (
+        workers <= 1
+        or archive is None
+        or os.path.getsize(archive) < PARALLEL_EXTRACT_MIN_SIZE
+    ):
+        _extract_zip_members(zf, members)
+        return
+
+    groups: list[list[tuple[zipfile.ZipInfo, Path, float]]] = [[] for _ in range(workers)]
+    loads = [0] * workers
+    for member in sorted(members, key=lambda m: m[0].compress_size, reverse=True):
+        i = loads.index(min(loads))
+        groups[i].append(member)
+        loads[i] += member[0].compress_size
+
+    def extract_group(group: list[tuple[zipfile.ZipInfo, Path, float]]) -> None:
+        with zipfile.ZipFile(archive) as own_zf:
+            _extract_zip_members(own_zf, group)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(extract_group, groups):
+            pass
+
+
+def _extract_zip_members(
+    zf: zipfile.ZipFile, members: list[tuple[zipfile.ZipInfo, Path, float]]
+) -> None:
+    for info, target, mtime in members:
+        # 先删除旧文件再写入新 inode，原地截断会使正在映射该库的进程崩溃（SIGBUS）
+        target.unlink(missing_ok=True)
+        with zf.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, EXTRACT_BLOCK_SIZE)
+        os.utime(target, (mtime, mtime))
+
+
+def extract_sdk(archive_path: Path, dest: Path) -> bool:
+    """
+    将归档中包含 bin 目录的 SDK 根目录直接解压到 dest（去掉其上层路径）。
+    dest 已存在时增量更新：跳过大小与修改时间一致的文件，并删除归档中已不存在的文件。
+    未找到 bin 目录时返回 False，且不改动 dest。
+    """
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as zf:
+            infos = zf.infolist()
+            prefix = _find_sdk_prefix((i.filename, i.is_dir()) for i in infos)
+            if prefix is None:
+                return False
+            extracted = []
+            dirs = {dest}
+            pending: list[tuple[zipfile.ZipInfo, Path, float]] = []
+            for info in infos:
+                if not info.filename.startswith(prefix) or info.filename == prefix:
+                    continue
+                rel = _safe_member_path(info.filename[len(prefix):])
+                if rel is None:
+                    continue
+                extracted.append(rel)
+                target = dest / rel
+                if info.is_dir():
+                    dirs.add(target)
+                    continue
+                # zip 不记录时区，date_time 按本地时间解释
+                mtime = time.mktime(info.date_time + (0, 0, -1))
+                if _is_unchanged(target, info.file_size, mtime):
+                    continue
+                dirs.add(target.parent)
+                pending.append((info, target, mtime))
+
+            # 目录一次性创建，避免逐个成员检查并创建父目录
+            for d in sorted(dirs):
+                d.mkdir(parents=True, exist_ok=True)
+            _write_zip_members(zf, pending)
+        _remove_stale(dest, _with_parents(extracted))
+        return True
+
+    with tarfile.open(archive_path) as tf:
+        members = tf.getmembers()
+        prefix = _find_sdk_prefix((m.name, m.isdir()) for m in members)
+        if prefix is None:
+            return False
+        extracted = []
+        selected = []
+        for member in members:
+            if not member.name.startswith(prefix) or member.name == prefix.rstrip("/"):
+                continue
+            member.name = member.name[len(prefix):]
+            if member.islnk() and member.linkname.startswith(prefix):
+                member.linkname = member.linkname[len(prefix):]
+            extracted.append(member.name)
+            target = dest / member.name
+            if member.isreg() and _is_unchanged(target, member.size, member.mtime):
+                continue
+            # 同 zip：已有文件先删除，避免 extractall 原地截断
+            target_st = _lstat_or_none(target)
+            if target_st is not None and not stat.S_ISDIR(target_st.st_mode):
+                target.unlink()
+            selected.append(member)
+        if hasattr(tarfile, "data_filter"):
+            tf.extractall(dest, selected, filter="data")
+        else:
+            tf.extractall(dest, selected)
+    _remove_stale(dest, _with_parents(extracted))
+    return True
+
+
 def install_maafw(
     install_root: Path,
     skip_if_exist: bool = True,
     update_mode: bool = False,
     local_version: str | None = None,
+    download_only: bool = False,
+    show_progress: bool = True,
 ) -> tuple[bool, str | None, bool]:
-    """安装 MaaFramework，若遇占用则提示用户手动处理"""
+    """安装 MaaFramework，若遇占用则提示用户手动处理；download_only 时仅下载到缓存"""
+    # 后台预下载时静默，避免与构建输出交错；失败由正式安装时重试并报告
+    echo = _discard if download_only else print_line
     real_install_root = install_root.resolve()
     maafw_dest = real_install_root / "maafw"
-    maafw_deps = PROJECT_BASE / "deps"
-    maafw_installed = maafw_deps.exists() and any(maafw_deps.iterdir())
+    maafw_deps = MAAFW_DEPS
+    maafw_installed = _is_non_empty_dir(maafw_deps)
 
     if skip_if_exist and maafw_installed:
-        print(Console.ok(t("inf_maafw_installed_skip")))
+        echo(Console.ok(t("inf_maafw_installed_skip")))
         return True, local_version, False
 
     url, filename, remote_version = get_latest_release_url(
-        MFW_REPO, ["maa", OS_KEYWORD, ARCH_KEYWORD]
+        MFW_REPO, ["maa", OS_KEYWORD, ARCH_KEYWORD], revalidate=update_mode,
+        quiet=download_only,
     )
     if not url or not filename:
-        print(Console.err(t("err_maafw_url_not_found")))
+        echo(Console.err(t("err_maafw_url_not_found")))
         return False, local_version, False
 
     if (
@@ -579,83 +1116,64 @@ def install_maafw(
         and remote_version
         and compare_semver(local_version, remote_version) >= 0
     ):
-        print(Console.ok(t("inf_maafw_latest_version", version=local_version)))
+        echo(Console.ok(t("inf_maafw_latest_version", version=local_version)))
         return True, local_version, False
 
     cache_dir = ensure_cache_dir()
     download_path = cache_dir / filename
-    if not download_file(url, download_path, resume=True):
+    if not download_file(
+        url, download_path, resume=True, show_progress=show_progress, quiet=download_only
+    ):
         return False, local_version, False
+    if download_only:
+        return True, local_version, False
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir)
-
-        maafw_dest_is_link = maafw_dest.is_symlink()
-        if hasattr(maafw_dest, 'is_junction'):
-            maafw_dest_is_link = maafw_dest_is_link or maafw_dest.is_junction()
-
-        if maafw_dest_is_link:
-            print(Console.ok(t("inf_link_already_exists", path=maafw_dest)))
-        elif maafw_dest.exists():
-            if maafw_dest.is_dir():
-                while True:
-                    try:
-                        print(Console.info(t("inf_delete_old_dir", path=maafw_dest)))
-                        shutil.rmtree(maafw_dest)
-                        break
-                    except PermissionError as e:
-                        print(Console.err(t("err_permission_denied", error=e)))
-                        print(Console.err(t("err_cannot_delete_maafw", path=maafw_dest)))
-                        cmd = input(t("prompt_retry_or_quit")).strip().lower()
-                        if cmd == "q":
-                            return False, local_version, False
-                    except Exception as e:
-                        print(Console.err(t("err_unknown_error_delete", error=e)))
-                        return False, local_version, False
-            else:
-                maafw_dest.unlink(missing_ok=True)
-
-        print(Console.info(t("inf_extract_maafw")))
-        try:
-            extract_root = tmp_path / "extracted"
-            extract_root.mkdir(parents=True, exist_ok=True)
-
-            # 使用 shutil.unpack_archive 自动识别格式进行解压
-            shutil.unpack_archive(str(download_path), extract_root)
+    maafw_dest_st = _lstat_or_none(maafw_dest)
+    maafw_dest_is_link = maafw_dest_st is not None and _is_link(maafw_dest_st)
 
-            # 找到包含 bin 目录的 SDK 根目录
-            sdk_root = None
-            for root, dirs, _ in os.walk(extract_root):
-                if "bin" in dirs:
-                    sdk_root = Path(root)
+    if maafw_dest_is_link:
+        print(Console.ok(t("inf_link_already_exists", path=maafw_dest)))
+    elif maafw_dest_st is not None:
+        if stat.S_ISDIR(maafw_dest_st.st_mode):
+            while True:
+                try:
+                    print(Console.info(t("inf_delete_old_dir", path=maafw_dest)))
+                    shutil.rmtree(maafw_dest)
                     break
-
-            if not sdk_root:
-                print(Console.err(t("err_bin_not_found")))
-                return False, local_version, False
-
-            # 先将完整 SDK 复制到项目根目录 deps/
-            maafw_deps = PROJECT_BASE / "deps"
-            print(Console.info(t("inf_copying_sdk", dest=maafw_deps)))
-            if maafw_deps.exists():
-                shutil.rmtree(maafw_deps)
-            shutil.copytree(sdk_root, maafw_deps)
-            print(Console.ok(t("inf_sdk_copied", dest=maafw_deps)))
-
-            if not maafw_dest_is_link:
-                # 创建 install/maafw -> deps/bin 的目录链接
-                bin_path = maafw_deps / "bin"
-                print(Console.info(t("inf_creating_link", link=maafw_dest, target=bin_path)))
-                if not create_directory_link(bin_path, maafw_dest):
-                    print(Console.err(t("err_create_link_failed")))
+                except PermissionError as e:
+                    print(Console.err(t("err_permission_denied", error=e)))
+                    print(Console.err(t("err_cannot_delete_maafw", path=maafw_dest)))
+                    if not ask_retry():
+                        return False, local_version, False
+                except Exception as e:
+                    print(Console.err(t("err_unknown_error_delete", error=e)))
                     return False, local_version, False
+        else:
+            maafw_dest.unlink(missing_ok=True)
 
-            print(Console.ok(t("inf_maafw_install_complete")))
-            cleanup_cache_file(download_path)
-            return True, remote_version or local_version, True
-        except Exception as e:
-            print(Console.err(t("err_maafw_install_failed", error=e)))
+    print(Console.info(t("inf_extract_maafw")))
+    try:
+        # 将完整 SDK 直接解压到项目根目录 deps/
+        print(Console.info(t("inf_copying_sdk", dest=maafw_deps)))
+        if not extract_sdk(download_path, maafw_deps):
+            print(Console.err(t("err_bin_not_found")))
             return False, local_version, False
+        print(Console.ok(t("inf_sdk_copied", dest=maafw_deps)))
+
+        if not maafw_dest_is_link:
+            # 创建 install/maafw -> deps/bin 的目录链接
+            bin_path = maafw_deps / "bin"
+            print(Console.info(t("inf_creating_link", link=maafw_dest, target=bin_path)))
+            if not create_directory_link(bin_path, maafw_dest):
+                print(Console.err(t("err_create_link_failed")))
+                return False, local_version, False
+
+        print(Console.ok(t("inf_maafw_install_complete")))
+        cleanup_cache_file(download_path)
+        return True, remote_version or local_version, True
+    except Exception as e:
+        print(Console.err(t("err_maafw_install_failed", error=e)))
+        return False, local_version, False
 
 
 def install_mxu(
@@ -663,21 +1181,25 @@ def install_mxu(
     skip_if_exist: bool = True,
     update_mode: bool = False,
     local_version: str | None = None,
+    download_only: bool = False,
+    show_progress: bool = True,
 ) -> tuple[bool, str | None, bool]:
-    """安装 MXU，若遇占用则提示用户手动处理"""
+    """安装 MXU，若遇占用则提示用户手动处理；download_only 时仅下载到缓存"""
+    echo = _discard if download_only else print_line
     real_install_root = install_root.resolve()
     mxu_path = real_install_root / MXU_DIST_NAME
     mxu_installed = mxu_path.exists()
 
     if skip_if_exist and mxu_installed:
-        print(Console.ok(t("inf_mxu_installed_skip")))
+        echo(Console.ok(t("inf_mxu_installed_skip")))
         return True, local_version, False
 
     url, filename, remote_version = get_latest_release_url(
-        MXU_REPO, ["mxu", OS_KEYWORD, ARCH_KEYWORD]
+        MXU_REPO, ["mxu", OS_KEYWORD, ARCH_KEYWORD], revalidate=update_mode,
+        quiet=download_only,
     )
     if not url or not filename:
-        print(Console.err(t("err_mxu_url_not_found")))
+        echo(Console.err(t("err_mxu_url_not_found")))
         return False, local_version, False
 
     if (
@@ -687,13 +1209,17 @@ def install_mxu(
         and remote_version
         and compare_semver(local_version, remote_version) >= 0
     ):
-        print(Console.ok(t("inf_mxu_latest_version", version=local_version)))
+        echo(Console.ok(t("inf_mxu_latest_version", version=local_version)))
         return True, local_version, False
 
     cache_dir = ensure_cache_dir()
     download_path = cache_dir / filename
-    if not download_file(url, download_path, resume=True):
+    if not download_file(
+        url, download_path, resume=True, show_progress=show_progress, quiet=download_only
+    ):
         return False, local_version, False
+    if download_only:
+        return True, local_version, False
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
@@ -707,8 +1233,7 @@ def install_mxu(
                 except PermissionError as e:
                     print(Console.err(t("err_permission_denied", error=e)))
                     print(Console.err(t("err_cannot_delete_mxu", name=MXU_DIST_NAME)))
-                    cmd = input(t("prompt_retry_or_quit")).strip().lower()
-                    if cmd == "q":
+                    if not ask_retry():
                         return False, local_version, False
                 except Exception as e:
                     print(Console.err(t("err_unknown_error_delete_file", error=e)))
@@ -747,13 +1272,31 @@ def install_mxu(
             return False, local_version, False
 
 
+def _scan_files(root: Path, names: set[str]) -> list[Path]:
+    """
+    用 os.scandir 单次遍历 root，返回文件名（不区分大小写）属于 names 的文件。
+    复用 DirEntry 自带的类型信息，不跟随目录符号链接。
+    """
+    found: list[Path] = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower() in names and entry.is_file():
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    return found
+
+
 def find_cpp_algo_binary(search_root: Path) -> Path | None:
     preferred_names = (
         ["cpp-algo.exe", "cpp-algo"] if OS_KEYWORD == "win" else ["cpp-algo", "cpp-algo.exe"]
     )
-    candidates: list[Path] = []
-    for name in preferred_names:
-        candidates.extend(path for path in search_root.rglob(name) if path.is_file())
+    candidates = _scan_files(search_root, set(preferred_names))
 
     if not candidates:
         return None
@@ -791,9 +1334,8 @@ def _replace_file_with_retry(src_path: Path, target_path: Path) -> None:
             return
         except PermissionError as e:
             tmp_target.unlink(missing_ok=True)
-            print(Console.err(t("err_permission_denied", error=e)))
-            cmd = input(t("prompt_retry_or_quit")).strip().lower()
-            if cmd == "q":
+            print_line(Console.err(t("err_permission_denied", error=e)))
+            if not ask_retry():
                 raise
         except Exception:
             tmp_target.unlink(missing_ok=True)
@@ -814,7 +1356,7 @@ def copy_cpp_algo_binary(src_path: Path, install_root: Path) -> None:
 
     target_path = agent_dir / CPP_ALGO_DIST_NAME
     _replace_file_with_retry(src_path, target_path)
-    print(Console.ok(t("inf_updated_file", name=target_path.name)))
+    print_line(Console.ok(t("inf_updated_file", name=target_path.name)))
 
     if OS_KEYWORD != "win":
         target_path.chmod(target_path.stat().st_mode | 0o111)
@@ -823,7 +1365,7 @@ def copy_cpp_algo_binary(src_path: Path, install_root: Path) -> None:
     if pdb_src.exists():
         pdb_target = agent_dir / f"{Path(CPP_ALGO_DIST_NAME).stem}.pdb"
         _replace_file_with_retry(pdb_src, pdb_target)
-        print(Console.ok(t("inf_updated_file", name=pdb_target.name)))
+        print_line(Console.ok(t("inf_updated_file", name=pdb_target.name)))
 
 
 def install_cpp_algo(
@@ -831,20 +1373,24 @@ def install_cpp_algo(
     skip_if_exist: bool = True,
     update_mode: bool = False,
     local_version: str | None = None,
+    download_only: bool = False,
+    show_progress: bool = True,
 ) -> tuple[bool, str | None, bool]:
+    echo = _discard if download_only else print_line
     real_install_root = install_root.resolve()
     cpp_algo_path = real_install_root / "agent" / CPP_ALGO_DIST_NAME
     cpp_algo_installed = cpp_algo_path.exists()
 
     if skip_if_exist and cpp_algo_installed:
-        print(Console.ok(t("inf_cpp_algo_installed_skip")))
+        echo(Console.ok(t("inf_cpp_algo_installed_skip")))
         return True, local_version, False
 
     url, filename, remote_version = get_latest_release_url(
-        MAAEND_REPO, ["maaend", OS_KEYWORD, ARCH_KEYWORD]
+        MAAEND_REPO, ["maaend", OS_KEYWORD, ARCH_KEYWORD], revalidate=update_mode,
+        quiet=download_only,
     )
     if not url or not filename:
-        print(Console.err(t("err_cpp_algo_url_not_found")))
+        echo(Console.err(t("err_cpp_algo_url_not_found")))
         return False, local_version, False
 
     if (
@@ -854,13 +1400,17 @@ def install_cpp_algo(
         and remote_version
         and compare_semver(local_version, remote_version) >= 0
     ):
-        print(Console.ok(t("inf_cpp_algo_latest_version", version=local_version)))
+        echo(Console.ok(t("inf_cpp_algo_latest_version", version=local_version)))
         return True, local_version, False
 
     cache_dir = ensure_cache_dir()
     download_path = cache_dir / filename
-    if not download_file(url, download_path, resume=True):
+    if not download_file(
+        url, download_path, resume=True, show_progress=show_progress, quiet=download_only
+    ):
         return False, local_version, False
+    if download_only:
+        return True, local_version, False
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
@@ -869,7 +1419,7 @@ def install_cpp_algo(
         try:
             lower_filename = filename.lower()
             if lower_filename.endswith(".dmg"):
-                if platform.system() != "Darwin":
+                if _SYSTEM != "darwin":
                     print(Console.err(t("err_cpp_algo_dmg_unsupported")))
                     return False, local_version, False
 
@@ -941,6 +1491,44 @@ def install_cpp_algo(
             return False, local_version, False
 
 
+def _run_in_daemon_thread(fn: Callable, *args, **kwargs) -> Future:
+    """在守护线程中执行 fn 并返回其 Future；进程退出时不等待该线程结束"""
+    future: Future = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def wait_for_prefetch(threads: list[threading.Thread]) -> None:
+    """等待后台预下载完成，期间汇总显示其下载进度"""
+    if not any(thread.is_alive() for thread in threads):
+        return
+    print(Console.info(t("inf_waiting_prefetch")))
+    progress_line = Console.info(t("inf_downloading", progress="\0"))
+    shown = False
+    for thread in threads:
+        while thread.is_alive():
+            thread.join(PROGRESS_INTERVAL)
+            entries = list(_BACKGROUND_PROGRESS.values())
+            if not entries:
+                continue
+            received = sum(size for size, _ in entries)
+            total = sum(size for _, size in entries)
+            progress_str = f"{_to_file_size(received)}/{_to_file_size(total)}"
+            if total > 0:
+                progress_str += f" ({received / total * 100:.1f}%)"
+            write_progress(progress_line.replace("\0", progress_str))
+            shown = True
+    if shown:
+        print()
+
+
 def _is_cn_locale() -> bool:
     """检测当前系统语言是否为简体中文"""
     import locale as _locale
@@ -976,6 +1564,34 @@ def main() -> None:
     local_versions = read_versions_file(version_file)
     print(Console.hdr(t("header_workspace_init")))
     configure_token()
+    installers = [
+        ("maafw", install_maafw, "fatal_maafw_failed"),
+        ("mxu", install_mxu, "fatal_mxu_failed"),
+        ("cpp_algo", install_cpp_algo, "fatal_cpp_algo_failed"),
+    ]
+
+    def run_installer(key, installer, **kwargs) -> tuple[bool, str | None, bool]:
+        return installer(
+            install_dir,
+            skip_if_exist=not args.update,
+            update_mode=args.update,
+            local_version=local_versions.get(key),
+            **kwargs,
+        )
+
+    # 依赖下载不依赖子模块与构建结果，在后台静默提前下载到缓存，与构建并行
+    prefetch_threads: list[threading.Thread] = []
+    if not args.ci:
+        for key, installer, _ in installers:
+            thread = threading.Thread(
+                target=run_installer,
+                args=(key, installer),
+                kwargs={"download_only": True},
+                daemon=True,
+            )
+            thread.start()
+            prefetch_threads.append(thread)
+
     if not update_submodules(skip_if_exist=not args.update):
         print(Console.err(t("fatal_submodule_failed")))
         sys.exit(1)
@@ -988,46 +1604,37 @@ def main() -> None:
         print(Console.err(t("fatal_build_failed")))
         sys.exit(1)
     print(Console.hdr(t("header_download_deps")))
+    wait_for_prefetch(prefetch_threads)
     versions: dict[str, str] = dict(local_versions)
     any_downloaded = False
-    maafw_ok, maafw_version, maafw_downloaded = install_maafw(
-        install_dir,
-        skip_if_exist=not args.update,
-        update_mode=args.update,
-        local_version=local_versions.get("maafw"),
-    )
-    if not maafw_ok:
-        print(Console.err(t("fatal_maafw_failed")))
-        sys.exit(1)
-    if maafw_version:
-        versions["maafw"] = maafw_version
-    any_downloaded = any_downloaded or maafw_downloaded
-
-    mxu_ok, mxu_version, mxu_downloaded = install_mxu(
-        install_dir,
-        skip_if_exist=not args.update,
-        update_mode=args.update,
-        local_version=local_versions.get("mxu"),
-    )
-    if not mxu_ok:
-        print(Console.err(t("fatal_mxu_failed")))
-        sys.exit(1)
-    if mxu_version:
-        versions["mxu"] = mxu_version
-    any_downloaded = any_downloaded or mxu_downloaded
-
-    cpp_algo_ok, cpp_algo_version, cpp_algo_downloaded = install_cpp_algo(
-        install_dir,
-        skip_if_exist=not args.update,
-        update_mode=args.update,
-        local_version=local_versions.get("cpp_algo"),
-    )
-    if not cpp_algo_ok:
-        print(Console.err(t("fatal_cpp_algo_failed")))
-        sys.exit(1)
-    if cpp_algo_version:
-        versions["cpp_algo"] = cpp_algo_version
-    any_downloaded = any_downloaded or cpp_algo_downloaded
+
+    if args.ci:
+        # CI 下顺序安装，保持日志整洁
+        results = ((entry, run_installer(*entry[:2])) for entry in installers)
+    else:
+        # 各依赖的下载与安装互不相关，并发执行以重叠网络等待；
+        # 多个回车进度行会互相覆盖，并发时只输出整行信息。
+        # 使用守护线程，任一依赖失败即可退出，无需等待其余安装及其重试提示
+        futures = {
+            _run_in_daemon_thread(run_installer, key, installer, show_progress=False): (
+                key, installer, fatal_key
+            )
+            for key, installer, fatal_key in installers
+        }
+        results = ((futures[future], future.result()) for future in as_completed(futures))
+
+    for (key, _, fatal_key), (ok, version, downloaded) in results:
+        if not ok:
+            print(Console.err(t(fatal_key)))
+            if args.ci:
+                sys.exit(1)
+            # 其余安装可能正阻塞在重试提示的 input() 中，解释器退出时会因其持有
+            # stdin 而中止，因此直接结束进程
+            sys.stdout.flush()
+            os._exit(1)
+        if version:
+            versions[key] = version
+        any_downloaded = any_downloaded or downloaded
 
     if not args.ci and any_downloaded:
         write_versions_file(version_file, versions)